@@ -43,16 +43,17 @@ class DatabaseOperations:
             updated_at = CURRENT_TIMESTAMP
         """
         
+        records = [
+            (stock.ts_code, stock.symbol, stock.name, stock.area,
+             stock.industry, stock.market, stock.list_date, stock.is_hs)
+            for stock in stocks
+        ]
+        
         async with pool.acquire() as conn:
             async with conn.transaction():
-                rows_affected = 0
-                for stock in stocks:
-                    await conn.execute(
-                        insert_sql,
-                        stock.ts_code, stock.symbol, stock.name, stock.area,
-                        stock.industry, stock.market, stock.list_date, stock.is_hs
-                    )
-                    rows_affected += 1
+                # executemany 在一次往返中流水线提交所有行
+                await conn.executemany(insert_sql, records)
+                rows_affected = len(records)
                 
                 logger.info(f"插入/更新了 {rows_affected} 条股票基础信息")
                 return rows_affected
@@ -94,17 +95,18 @@ class DatabaseOperations:
             amount = EXCLUDED.amount
         """
         
+        records = [
+            (data.ts_code, data.trade_date, data.open, data.high, data.low,
+             data.close, data.pre_close, data.change, data.pct_chg, 
+             data.vol, data.amount)
+            for data in daily_data
+        ]
+        
         async with pool.acquire() as conn:
             async with conn.transaction():
-                rows_affected = 0
-                for data in daily_data:
-                    await conn.execute(
-                        insert_sql,
-                        data.ts_code, data.trade_date, data.open, data.high, data.low,
-                        data.close, data.pre_close, data.change, data.pct_chg, 
-                        data.vol, data.amount
-                    )
-                    rows_affected += 1
+                # executemany 在一次往返中流水线提交所有行
+                await conn.executemany(insert_sql, records)
+                rows_affected = len(records)
                 
                 logger.info(f"插入/更新了 {rows_affected} 条日线数据")
                 return rows_affected
@@ -174,18 +176,19 @@ class DatabaseOperations:
             circ_mv = EXCLUDED.circ_mv
         """
         
+        records = [
+            (data.ts_code, data.trade_date, data.close, data.turnover_rate,
+             data.volume_ratio, data.pe, data.pb, data.ps, data.dv_ratio,
+             data.dv_ttm, data.total_share, data.float_share, data.free_share,
+             data.total_mv, data.circ_mv)
+            for data in basic_data
+        ]
+        
         async with pool.acquire() as conn:
             async with conn.transaction():
-                rows_affected = 0
-                for data in basic_data:
-                    await conn.execute(
-                        insert_sql,
-                        data.ts_code, data.trade_date, data.close, data.turnover_rate,
-                        data.volume_ratio, data.pe, data.pb, data.ps, data.dv_ratio,
-                        data.dv_ttm, data.total_share, data.float_share, data.free_share,
-                        data.total_mv, data.circ_mv
-                    )
-                    rows_affected += 1
+                # executemany 在一次往返中流水线提交所有行
+                await conn.executemany(insert_sql, records)
+                rows_affected = len(records)
                 
                 logger.info(f"插入/更新了 {rows_affected} 条每日基本面数据")
                 return rows_affected
@@ -212,19 +215,20 @@ class DatabaseOperations:
             reason = EXCLUDED.reason
         """
         
+        records = [
+            (result.ts_code, result.trade_date, result.total_score,
+             result.volume_price_score, result.chip_score, 
+             result.dragon_tiger_score, result.theme_score,
+             result.money_flow_score, result.rank_position,
+             result.is_candidate, result.reason)
+            for result in results
+        ]
+        
         async with pool.acquire() as conn:
             async with conn.transaction():
-                rows_affected = 0
-                for result in results:
-                    await conn.execute(
-                        insert_sql,
-                        result.ts_code, result.trade_date, result.total_score,
-                        result.volume_price_score, result.chip_score, 
-                        result.dragon_tiger_score, result.theme_score,
-                        result.money_flow_score, result.rank_position,
-                        result.is_candidate, result.reason
-                    )
-                    rows_affected += 1
+                # executemany 在一次往返中流水线提交所有行
+                await conn.executemany(insert_sql, records)
+                rows_affected = len(records)
                 
                 logger.info(f"插入/更新了 {rows_affected} 条策略结果")
                 return rows_affected
@@ -417,18 +421,19 @@ class DatabaseOperations:
             limit_amount = EXCLUDED.limit_amount
         """
         
+        records = [
+            (data.trade_date, data.ts_code, data.name, data.close,
+             data.pct_chg, data.amount, data.limit, data.fd_amount,
+             data.first_time, data.last_time, data.open_times,
+             data.strth, data.limit_amount)
+            for data in limit_data
+        ]
+        
         async with pool.acquire() as conn:
             async with conn.transaction():
-                rows_affected = 0
-                for data in limit_data:
-                    await conn.execute(
-                        insert_sql,
-                        data.trade_date, data.ts_code, data.name, data.close,
-                        data.pct_chg, data.amount, data.limit, data.fd_amount,
-                        data.first_time, data.last_time, data.open_times,
-                        data.strth, data.limit_amount
-                    )
-                    rows_affected += 1
+                # executemany 在一次往返中流水线提交所有行
+                await conn.executemany(insert_sql, records)
+                rows_affected = len(records)
                 
                 logger.info(f"插入/更新了 {rows_affected} 条涨跌停数据")
                 return rows_affected
@@ -473,21 +478,22 @@ class DatabaseOperations:
             net_mf_amount = EXCLUDED.net_mf_amount
         """
         
+        records = [
+            (data.trade_date, data.ts_code, data.name, data.close,
+             data.pct_chg, data.vol, data.amount,
+             data.buy_sm_vol, data.buy_sm_amount, data.sell_sm_vol, data.sell_sm_amount,
+             data.buy_md_vol, data.buy_md_amount, data.sell_md_vol, data.sell_md_amount,
+             data.buy_lg_vol, data.buy_lg_amount, data.sell_lg_vol, data.sell_lg_amount,
+             data.buy_elg_vol, data.buy_elg_amount, data.sell_elg_vol, data.sell_elg_amount,
+             data.net_mf_vol, data.net_mf_amount)
+            for data in money_flow_data
+        ]
+        
         async with pool.acquire() as conn:
             async with conn.transaction():
-                rows_affected = 0
-                for data in money_flow_data:
-                    await conn.execute(
-                        insert_sql,
-                        data.trade_date, data.ts_code, data.name, data.close,
-                        data.pct_chg, data.vol, data.amount,
-                        data.buy_sm_vol, data.buy_sm_amount, data.sell_sm_vol, data.sell_sm_amount,
-                        data.buy_md_vol, data.buy_md_amount, data.sell_md_vol, data.sell_md_amount,
-                        data.buy_lg_vol, data.buy_lg_amount, data.sell_lg_vol, data.sell_lg_amount,
-                        data.buy_elg_vol, data.buy_elg_amount, data.sell_elg_vol, data.sell_elg_amount,
-                        data.net_mf_vol, data.net_mf_amount
-                    )
-                    rows_affected += 1
+                # executemany 在一次往返中流水线提交所有行
+                await conn.executemany(insert_sql, records)
+                rows_affected = len(records)
                 
                 logger.info(f"插入/更新了 {rows_affected} 条资金流向数据")
                 return rows_affected
@@ -517,18 +523,19 @@ class DatabaseOperations:
             reason_type = EXCLUDED.reason_type
         """
         
+        records = [
+            (data.trade_date, data.ts_code, data.name, data.close,
+             data.pct_chg, data.turnover_rate, data.reason,
+             data.buy_amount, data.sell_amount, data.net_amount,
+             data.amount_ratio, data.float_values, data.reason_type)
+            for data in top_list_data
+        ]
+        
         async with pool.acquire() as conn:
             async with conn.transaction():
-                rows_affected = 0
-                for data in top_list_data:
-                    await conn.execute(
-                        insert_sql,
-                        data.trade_date, data.ts_code, data.name, data.close,
-                        data.pct_chg, data.turnover_rate, data.reason,
-                        data.buy_amount, data.sell_amount, data.net_amount,
-                        data.amount_ratio, data.float_values, data.reason_type
-                    )
-                    rows_affected += 1
+                # executemany 在一次往返中流水线提交所有行
+                await conn.executemany(insert_sql, records)
+                rows_affected = len(records)
                 
                 logger.info(f"插入/更新了 {rows_affected} 条龙虎榜数据")
                 return rows_affected
@@ -553,17 +560,18 @@ class DatabaseOperations:
             reason = EXCLUDED.reason
         """
         
+        records = [
+            (data.trade_date, data.ts_code, data.exalter, data.buy,
+             data.buy_rate, data.sell, data.sell_rate, data.net_buy,
+             data.side, data.reason)
+            for data in top_inst_data
+        ]
+        
         async with pool.acquire() as conn:
             async with conn.transaction():
-                rows_affected = 0
-                for data in top_inst_data:
-                    await conn.execute(
-                        insert_sql,
-                        data.trade_date, data.ts_code, data.exalter, data.buy,
-                        data.buy_rate, data.sell, data.sell_rate, data.net_buy,
-                        data.side, data.reason
-                    )
-                    rows_affected += 1
+                # executemany 在一次往返中流水线提交所有行
+                await conn.executemany(insert_sql, records)
+                rows_affected = len(records)
                 
                 logger.info(f"插入/更新了 {rows_affected} 条龙虎榜机构数据")
                 return rows_affected
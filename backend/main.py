@@ -22,6 +22,7 @@ from routers import (
     settings as settings_router
 )
 from services.scheduler import StrategyScheduler
+from services.tushare_client import close_tushare_client
 from utils.logger import setup_logger
 
 # 设置日志
@@ -62,6 +63,7 @@ async def lifespan(app: FastAPI):
     # 关闭时执行
     logger.info("正在关闭量化选股系统...")
     scheduler.shutdown()
+    close_tushare_client()
     logger.info("系统关闭完成")
 
 # 创建FastAPI应用
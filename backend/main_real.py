@@ -3,6 +3,8 @@
 集成Tushare API和完整策略逻辑
 """
 
+import asyncio
+import heapq
 import uvicorn
 import logging
 import tushare as ts
@@ -115,6 +117,10 @@ class CandidateStock(BaseModel):
 cache = {}
 cache_expire = {}
 
+# 各类数据的缓存时长(分钟)
+REAL_DATA_CACHE_MINUTES = 60
+STOCK_BASIC_CACHE_MINUTES = 24 * 60
+
 def get_cache(key: str, expire_minutes: int = 30):
     """获取缓存数据"""
     now = datetime.now()
@@ -147,42 +153,60 @@ def get_trade_date(date_str: str = None) -> str:
     
     return today.strftime('%Y%m%d')
 
+def _load_real_data(trade_date: str) -> Optional[pd.DataFrame]:
+    """同步获取并合并当日行情、基本面和股票基本信息"""
+    # 获取基础数据
+    daily_data = pro.daily(trade_date=trade_date, fields='ts_code,close,pre_close,change,pct_chg,vol,amount')
+    daily_basic = pro.daily_basic(trade_date=trade_date, fields='ts_code,turnover_rate,volume_ratio,pe,pb,total_mv,circ_mv')
+    
+    if daily_data.empty:
+        logger.warning(f"{trade_date}无交易数据，可能不是交易日")
+        return None
+    
+    # 合并数据
+    merged_data = daily_data.merge(daily_basic, on='ts_code', how='left')
+    
+    # 获取股票基本信息
+    try:
+        # 股票基本信息一年只变动几次，单独缓存24小时，不随行情缓存每小时重新拉取
+        stock_basic = get_cache("stock_basic")
+        if stock_basic is None:
+            stock_basic = pro.stock_basic(exchange='', list_status='L', fields='ts_code,name,industry')
+            set_cache("stock_basic", stock_basic, STOCK_BASIC_CACHE_MINUTES)
+        merged_data = merged_data.merge(stock_basic, on='ts_code', how='left')
+    except:
+        logger.warning("获取股票基本信息失败")
+        merged_data['name'] = merged_data['ts_code']
+        merged_data['industry'] = '其他'
+    
+    # 数据预处理
+    merged_data = merged_data.fillna(0)
+
+    # 行业只有百余个取值，转为category减少缓存占用（数值列保持float64，避免响应中出现精度噪声）
+    if 'industry' in merged_data.columns:
+        merged_data['industry'] = merged_data['industry'].astype('category')
+    
+    return merged_data
+
 async def get_real_data(trade_date: str):
     """获取真实股票数据"""
     cache_key = f"real_data_{trade_date}"
-    cached = get_cache(cache_key, 60)  # 缓存60分钟
-    if cached:
+    cached = get_cache(cache_key)
+    if cached is not None:
         return cached
     
     try:
         logger.info(f"开始获取{trade_date}的真实数据")
         
-        # 获取基础数据
-        daily_data = pro.daily(trade_date=trade_date, fields='ts_code,close,pre_close,change,pct_chg,vol,amount')
-        daily_basic = pro.daily_basic(trade_date=trade_date, fields='ts_code,turnover_rate,volume_ratio,pe,pb,total_mv,circ_mv')
-        
-        if daily_data.empty:
-            logger.warning(f"{trade_date}无交易数据，可能不是交易日")
+        # Tushare调用与合并都是同步阻塞操作，整体放到线程池执行，避免阻塞事件循环
+        loop = asyncio.get_running_loop()
+        merged_data = await loop.run_in_executor(None, _load_real_data, trade_date)
+        if merged_data is None:
             return None
         
-        # 合并数据
-        merged_data = daily_data.merge(daily_basic, on='ts_code', how='left')
-        
-        # 获取股票基本信息
-        try:
-            stock_basic = pro.stock_basic(exchange='', list_status='L', fields='ts_code,name,industry')
-            merged_data = merged_data.merge(stock_basic, on='ts_code', how='left')
-        except:
-            logger.warning("获取股票基本信息失败")
-            merged_data['name'] = merged_data['ts_code']
-            merged_data['industry'] = '其他'
-        
-        # 数据预处理
-        merged_data = merged_data.fillna(0)
-        
         logger.info(f"成功获取{len(merged_data)}条股票数据")
         
-        set_cache(cache_key, merged_data)
+        set_cache(cache_key, merged_data, REAL_DATA_CACHE_MINUTES)
         return merged_data
         
     except Exception as e:
@@ -226,7 +250,7 @@ async def run_real_strategy(data: pd.DataFrame) -> List[Dict]:
         # 2. 计算评分
         candidates = []
         
-        for idx, row in filtered.iterrows():
+        for row in filtered.to_dict('records'):
             try:
                 # 量价分数
                 volume_price_score = (
@@ -296,16 +320,11 @@ async def run_real_strategy(data: pd.DataFrame) -> List[Dict]:
                 logger.warning(f"处理股票{row['ts_code']}时出错: {e}")
                 continue
         
-        # 按评分排序
-        candidates.sort(key=lambda x: x['total_score'], reverse=True)
-        
-        # 设置排名
+        # 按评分取前30只（堆选择，同分保持原顺序），只对入选的股票设置排名
+        candidates = heapq.nlargest(30, candidates, key=lambda x: x['total_score'])
         for i, candidate in enumerate(candidates):
             candidate['rank_position'] = i + 1
         
-        # 取前30只
-        candidates = candidates[:30]
-        
         logger.info(f"策略运行完成，筛选出{len(candidates)}只候选股票")
         return candidates
         
@@ -4,6 +4,7 @@
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import logging
 from datetime import datetime, date
@@ -16,7 +17,8 @@ from services.scheduler import StrategyScheduler
 from config import ResponseCode
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# orjson 直接处理 datetime 等类型，序列化开销低于标准 json
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # 请求模型
 class StrategyRecomputeRequest(BaseModel):
@@ -63,14 +65,16 @@ async def recompute_strategy(
         success = await scheduler.manual_trigger(target_date)
         
         if success:
+            # 同一响应内复用一次时间快照
+            now = datetime.now()
             return ApiResponse(
                 code=ResponseCode.SUCCESS,
                 message="策略重新计算完成",
                 data={
-                    'trade_date': target_date.strftime('%Y-%m-%d') if target_date else datetime.now().strftime('%Y-%m-%d'),
-                    'completed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'trade_date': (target_date or now.date()).strftime('%Y-%m-%d'),
+                    'completed_at': now.strftime('%Y-%m-%d %H:%M:%S')
                 },
-                timestamp=datetime.now()
+                timestamp=now
             )
         else:
             raise HTTPException(
@@ -103,14 +107,15 @@ async def update_strategy_config(
         success = await strategy_engine.update_strategy_config(request.config_updates)
         
         if success:
+            now = datetime.now()
             return ApiResponse(
                 code=ResponseCode.SUCCESS,
                 message="策略配置更新成功",
                 data={
                     'updated_config': request.config_updates,
-                    'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'updated_at': now.strftime('%Y-%m-%d %H:%M:%S')
                 },
-                timestamp=datetime.now()
+                timestamp=now
             )
         else:
             raise HTTPException(
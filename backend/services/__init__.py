@@ -3,12 +3,14 @@
 包含数据获取、策略计算、调度等核心业务逻辑
 """
 
-from .tushare_client import TushareClient
+from .tushare_client import TushareClient, get_tushare_client, close_tushare_client
 from .strategy_engine import StrategyEngine
 from .scheduler import StrategyScheduler
 
 __all__ = [
     'TushareClient',
+    'get_tushare_client',
+    'close_tushare_client',
     'StrategyEngine', 
     'StrategyScheduler'
 ]
@@ -2,11 +2,33 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 import logging
-from datetime import datetime, timedelta
-import math
+import threading
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional; without it batches go through the per-stock pandas path
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 logger = logging.getLogger(__name__)
 
+# Serializes parallel kernel launches: batches run on executor threads, and numba's
+# workqueue threading layer (used when neither TBB nor OpenMP is installed)
+# aborts the process on concurrent launches
+_PARALLEL_KERNEL_LOCK = threading.Lock()
+
+# Metrics produced by the advanced calculation, in kernel output order
+CHIP_METRIC_NAMES = ('chip_concentration', 'concentration_index', 'profit_ratio',
+                     'chip_stability', 'turnover_concentration')
+
 class ChipConcentrationCalculator:
     """
     Advanced chip concentration calculator based on cost distribution analysis.
@@ -26,6 +48,10 @@ class ChipConcentrationCalculator:
         """
         self.lookback_days = lookback_days
         self.decay_factor = decay_factor
+        # Decay weights indexed by calendar days ago (read-only, shared between
+        # instances). Calendar spans run longer than the trading-day lookback, so
+        # size it generously; _get_decay_weights grows it if an older record shows up.
+        self._decay = self._build_decay_table(lookback_days * 2)
         
     def calculate_chip_concentration(self, 
                                    current_price: float,
@@ -41,148 +67,266 @@ class ChipConcentrationCalculator:
             Dict containing concentration metrics
         """
         try:
-            if len(historical_data) < 5:
+            # Extract every column the metrics need exactly once
+            arrays = self._extract_history_arrays(current_price, historical_data)
+            if arrays is None:
                 return self._fallback_calculation(current_price, historical_data)
             
-            # Calculate cost distribution
-            cost_distribution = self._calculate_cost_distribution(historical_data)
-            
-            # Calculate concentration index
-            concentration_index = self._calculate_concentration_index(cost_distribution)
-            
-            # Calculate profit ratio
-            profit_ratio = self._calculate_profit_ratio(current_price, cost_distribution)
-            
-            # Calculate chip stability
-            chip_stability = self._calculate_chip_stability(historical_data)
-            
-            # Calculate turnover concentration
-            turnover_concentration = self._calculate_turnover_concentration(historical_data)
-            
-            # Combine multiple factors for final concentration score
-            final_concentration = self._combine_concentration_factors(
-                concentration_index, chip_stability, turnover_concentration
-            )
-            
-            return {
-                'chip_concentration': round(final_concentration, 4),
-                'concentration_index': round(concentration_index, 4),
-                'profit_ratio': round(profit_ratio, 4),
-                'chip_stability': round(chip_stability, 4),
-                'turnover_concentration': round(turnover_concentration, 4),
-                'calculation_method': 'advanced'
-            }
+            return self._format_metrics(self._calculate_metrics(*arrays))[0]
             
         except Exception as e:
             logger.warning(f"Advanced calculation failed: {e}, falling back to simple method")
             return self._fallback_calculation(current_price, historical_data)
     
-    def _calculate_cost_distribution(self, historical_data: pd.DataFrame) -> Dict[float, float]:
+    def calculate_chip_concentration_batch(self,
+                                         current_prices: List[float],
+                                         historical_data_list: List[pd.DataFrame]) -> List[Dict[str, float]]:
+        """
+        Calculate chip concentration metrics for many stocks at once.
+        
+        When numba is available, every stock with enough usable history is packed
+        into flat arrays and evaluated by a single parallel kernel; the rest go
+        through calculate_chip_concentration. Without numba, every stock goes
+        through calculate_chip_concentration.
+        
+        Args:
+            current_prices: Current price of each stock
+            historical_data_list: Historical DataFrame of each stock, same order
+            
+        Returns:
+            List of metric dicts, same order as the inputs
+        """
+        if not NUMBA_AVAILABLE:
+            return [self.calculate_chip_concentration(price, data)
+                    for price, data in zip(current_prices, historical_data_list)]
+        
+        results: List[Optional[Dict[str, float]]] = [None] * len(historical_data_list)
+        positions, prices, columns = [], [], []
+        
+        for i, (price, data) in enumerate(zip(current_prices, historical_data_list)):
+            arrays = self._extract_history_arrays(price, data)
+            if arrays is None:
+                results[i] = self.calculate_chip_concentration(price, data)
+            else:
+                positions.append(i)
+                prices.append(arrays[0])
+                columns.append(arrays[1:])
+        
+        if not positions:
+            return results
+        
+        close, volume, days_ago, turnover = (np.concatenate(col) for col in zip(*columns))
+        offsets = np.zeros(len(positions) + 1, dtype=np.int64)
+        np.cumsum([len(col[0]) for col in columns], out=offsets[1:])
+        
+        outputs = self._calculate_packed(offsets, np.array(prices, dtype=np.float64),
+                                         close, volume, days_ago, turnover)
+        
+        for i, metrics in zip(positions, self._format_metrics(outputs)):
+            results[i] = metrics
+        
+        return results
+    
+    def _calculate_metrics(self, current_price: float, close: np.ndarray, volume: np.ndarray,
+                           days_ago: np.ndarray, turnover: np.ndarray) -> Tuple[float, ...]:
+        """
+        Calculate the metrics of one stock from its history arrays.
+        
+        Returns (chip_concentration, concentration_index, profit_ratio,
+        chip_stability, turnover_concentration).
+        """
+        # Compiled single-stock kernel when numba is available
+        if NUMBA_AVAILABLE:
+            self._ensure_decay_table(days_ago)
+            return _chip_metrics_kernel(close, volume, days_ago, turnover, current_price, self._decay)
+        
+        # Calculate cost distribution
+        bucket_prices, bucket_volumes = self._calculate_cost_distribution(close, volume, days_ago)
+        
+        # Calculate concentration index
+        concentration_index = self._calculate_concentration_index(bucket_volumes)
+        
+        # Calculate profit ratio
+        profit_ratio = self._calculate_profit_ratio(current_price, bucket_prices, bucket_volumes)
+        
+        # Calculate chip stability
+        chip_stability = self._calculate_chip_stability(turnover)
+        
+        # Calculate turnover concentration
+        turnover_concentration = self._calculate_turnover_concentration(turnover)
+        
+        # Combine multiple factors for final concentration score
+        final_concentration = self._combine_concentration_factors(
+            concentration_index, chip_stability, turnover_concentration
+        )
+        
+        return final_concentration, concentration_index, profit_ratio, chip_stability, turnover_concentration
+    
+    def _calculate_packed(self, offsets: np.ndarray, current_prices: np.ndarray, close: np.ndarray,
+                          volume: np.ndarray, days_ago: np.ndarray, turnover: np.ndarray) -> np.ndarray:
+        """
+        Calculate metrics for stocks packed back to back in flat arrays.
+        
+        Stock s owns rows offsets[s]:offsets[s + 1] and needs at least 5 of them.
+        Returns a (5, n_stocks) array in _calculate_metrics order.
+        """
+        outputs = np.empty((5, len(offsets) - 1), dtype=np.float64)
+        
+        if NUMBA_AVAILABLE:
+            self._ensure_decay_table(days_ago)
+            with _PARALLEL_KERNEL_LOCK:
+                _chip_batch_kernel(offsets, close, volume, days_ago, turnover,
+                                   current_prices, self._decay, outputs)
+            return outputs
+        
+        for s in range(len(offsets) - 1):
+            rows = slice(offsets[s], offsets[s + 1])
+            outputs[:, s] = self._calculate_metrics(current_prices[s], close[rows], volume[rows],
+                                                    days_ago[rows], turnover[rows])
+        return outputs
+    
+    def _format_metrics(self, outputs) -> List[Dict[str, float]]:
+        """
+        Build result dicts from a (5, n_stocks) metrics array or a single
+        _calculate_metrics tuple, rounding all values in one np.round call.
+        """
+        rounded = np.round(np.asarray(outputs, dtype=np.float64).reshape(len(CHIP_METRIC_NAMES), -1), 4)
+        return [dict(zip(CHIP_METRIC_NAMES, column), calculation_method='advanced')
+                for column in rounded.T.tolist()]
+    
+    def _extract_history_arrays(self, current_price, historical_data):
+        """
+        Extract (current_price, close, volume, days_ago, turnover_rate) as float64
+        values in the input row order, or None when the history is too short or
+        its columns are unusable and the fallback calculation has to be used.
+        """
+        try:
+            if len(historical_data) < 5:
+                return None
+            dates = historical_data['date']
+            days_ago = (dates.max() - dates).dt.days.to_numpy(dtype=np.float64)
+            return (
+                float(current_price),
+                historical_data['close'].to_numpy(dtype=np.float64),
+                historical_data['volume'].to_numpy(dtype=np.float64),
+                days_ago,
+                historical_data['turnover_rate'].to_numpy(dtype=np.float64),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+    
+    def _calculate_cost_distribution(self, close: np.ndarray, volume: np.ndarray,
+                                     days_ago: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate chip cost distribution using volume-weighted price levels.
         
         This method estimates how many chips (shares) were acquired at different price levels
         based on historical trading data with time decay.
-        """
-        cost_distribution = {}
         
-        # Sort data by date (oldest first)
-        data = historical_data.sort_values('date').copy()
-        
-        # Calculate days ago for each record
-        latest_date = data['date'].max()
-        data['days_ago'] = (latest_date - data['date']).dt.days
+        Returns:
+            (bucket_prices, bucket_volumes): occupied 1% price buckets in ascending
+            order and the decayed volume in each. Volumes are left unnormalized;
+            the consumers only use ratios and divide by the total once.
+        """
+        # Skip records with missing or non-positive price/volume in one mask
+        valid = (np.isfinite(close) & np.isfinite(volume) & np.isfinite(days_ago)
+                 & (close > 0) & (volume > 0))
+        close = close[valid]
+        volume = volume[valid]
         
-        for _, row in data.iterrows():
-            price = row['close']
-            volume = row['volume']
-            days_ago = row['days_ago']
-            
-            # Apply time decay - older transactions have less weight
-            decay_weight = self.decay_factor ** (days_ago / 30)  # Monthly decay
-            
-            # Weight by volume and decay
-            weighted_volume = volume * decay_weight
-            
-            # Group into price buckets (1% intervals)
-            price_bucket = round(price * 100) / 100
-            
-            if price_bucket in cost_distribution:
-                cost_distribution[price_bucket] += weighted_volume
-            else:
-                cost_distribution[price_bucket] = weighted_volume
+        # Apply time decay - older transactions have less weight (monthly decay)
+        # and weight by volume
+        weighted_volumes = volume * self._get_decay_weights(days_ago[valid])
         
-        # Normalize to get distribution percentages
-        total_volume = sum(cost_distribution.values())
-        if total_volume > 0:
-            for price in cost_distribution:
-                cost_distribution[price] /= total_volume
+        # Group into price buckets (1% intervals) and sum each bucket in one pass
+        buckets, bucket_idx = np.unique(np.rint(close * 100), return_inverse=True)
+        bucket_volumes = np.bincount(bucket_idx, weights=weighted_volumes, minlength=len(buckets))
         
-        return cost_distribution
+        return buckets / 100, bucket_volumes
     
-    def _calculate_concentration_index(self, cost_distribution: Dict[float, float]) -> float:
+    def _build_decay_table(self, size: int) -> np.ndarray:
+        """
+        Get a decay weight table with at least `size` entries: entry d is
+        decay_factor ** (d / 30). Sizes are rounded up so instances share tables.
+        """
+        return _decay_table(self.decay_factor, -(-size // 128) * 128)
+    
+    def _ensure_decay_table(self, days_ago: np.ndarray) -> None:
+        """
+        Grow the decay table so the kernels can index it with any finite days_ago.
+        """
+        finite_days = days_ago[np.isfinite(days_ago)]
+        if len(finite_days):
+            self._get_decay_weights(np.array([finite_days.max()]))
+    
+    def _get_decay_weights(self, days_ago: np.ndarray) -> np.ndarray:
+        """
+        Look up decay weights for integer days-ago values from the cached table.
+        """
+        days_ago = days_ago.astype(np.int64, copy=False)
+        if len(days_ago) and days_ago.max() >= len(self._decay):
+            self._decay = self._build_decay_table(int(days_ago.max()) + 1)
+        return self._decay[days_ago]
+    
+    def _calculate_concentration_index(self, bucket_volumes: np.ndarray) -> float:
         """
         Calculate chip concentration index using Gini coefficient approach.
         
         Higher values indicate more concentrated chip distribution.
         """
-        if not cost_distribution:
-            return 0.5
-        
         # Sort by volume percentage
-        volumes = list(cost_distribution.values())
-        volumes.sort()
+        volumes = np.sort(bucket_volumes)
         
         n = len(volumes)
         if n == 0:
             return 0.5
         
-        # Calculate Gini coefficient
+        # Calculate Gini coefficient (rank weights applied as one dot product),
+        # normalizing the raw bucket volumes by their total in the same step
         cumsum = np.cumsum(volumes)
-        gini = (n + 1 - 2 * sum((n + 1 - i) * y for i, y in enumerate(cumsum))) / (n * sum(volumes))
+        gini = (n + 1 - 2 * np.dot(n + 1 - np.arange(n), cumsum) / volumes.sum()) / n
         
         # Convert Gini to concentration index (0-1, higher = more concentrated)
-        concentration = max(0.0, min(1.0, gini))
+        concentration = max(0.0, min(1.0, float(gini)))
         
         return concentration
     
     def _calculate_profit_ratio(self, current_price: float, 
-                               cost_distribution: Dict[float, float]) -> float:
+                               bucket_prices: np.ndarray,
+                               bucket_volumes: np.ndarray) -> float:
         """
         Calculate profit ratio - percentage of chips that are profitable at current price.
+        
+        bucket_prices must be ascending, as returned by _calculate_cost_distribution.
         """
-        if not cost_distribution:
+        if len(bucket_volumes) == 0:
             return 0.5
         
-        profitable_volume = 0
-        total_volume = 0
-        
-        for price, volume in cost_distribution.items():
-            total_volume += volume
-            if price < current_price:  # Profitable chips
-                profitable_volume += volume
+        total_volume = bucket_volumes.sum()
         
         if total_volume == 0:
             return 0.5
         
-        return profitable_volume / total_volume
+        # Profitable chips: buckets strictly below current price (NaN price -> none)
+        cutoff = np.searchsorted(bucket_prices, current_price, side='left') if current_price == current_price else 0
+        profitable_volume = bucket_volumes[:cutoff].sum()
+        
+        return float(profitable_volume / total_volume)
     
-    def _calculate_chip_stability(self, historical_data: pd.DataFrame) -> float:
+    def _calculate_chip_stability(self, turnover: np.ndarray) -> float:
         """
         Calculate chip stability based on turnover rate variance.
         
         Lower turnover variance indicates more stable chip structure.
         """
-        if len(historical_data) < 3:
+        if len(turnover) < 3:
             return 0.5
         
-        turnover_rates = historical_data['turnover_rate'].dropna()
-        if len(turnover_rates) == 0:
+        count, mean_turnover, std_turnover = _nan_mean_std(turnover)
+        if count == 0:
             return 0.5
         
         # Calculate coefficient of variation
-        mean_turnover = turnover_rates.mean()
-        std_turnover = turnover_rates.std()
         
         if mean_turnover == 0:
             return 0.5
@@ -194,19 +338,22 @@ class ChipConcentrationCalculator:
         
         return stability
     
-    def _calculate_turnover_concentration(self, historical_data: pd.DataFrame) -> float:
+    def _calculate_turnover_concentration(self, turnover: np.ndarray) -> float:
         """
         Calculate concentration based on recent turnover patterns.
         
         High recent turnover suggests chip redistribution and potential concentration.
         """
-        if len(historical_data) < 5:
+        if len(turnover) < 5:
             return 0.5
         
-        # Get recent vs historical turnover
-        recent_data = historical_data.tail(5)
-        historical_avg = historical_data['turnover_rate'].mean()
-        recent_avg = recent_data['turnover_rate'].mean()
+        # Get recent vs historical turnover: one NaN mask, then window sums
+        valid = ~np.isnan(turnover)
+        values = np.where(valid, turnover, 0.0)
+        total_count = np.count_nonzero(valid)
+        recent_count = np.count_nonzero(valid[-5:])
+        historical_avg = values.sum() / total_count if total_count else np.nan
+        recent_avg = values[-5:].sum() / recent_count if recent_count else np.nan
         
         if historical_avg == 0:
             return 0.5
@@ -256,9 +403,11 @@ class ChipConcentrationCalculator:
                 'calculation_method': 'fallback_default'
             }
         
-        # Get latest data
-        latest = historical_data.iloc[-1]
-        turnover_rate = latest.get('turnover_rate', 5.0)
+        # Get latest turnover straight from the column (no row Series)
+        if 'turnover_rate' in historical_data.columns:
+            turnover_rate = historical_data['turnover_rate'].iat[-1]
+        else:
+            turnover_rate = 5.0
         
         # Improved simple calculation
         # Base concentration from turnover (high turnover can indicate redistribution)
@@ -266,8 +415,9 @@ class ChipConcentrationCalculator:
         
         # Adjust based on recent price stability
         if len(historical_data) >= 5:
-            recent_prices = historical_data.tail(5)['close']
-            price_cv = recent_prices.std() / recent_prices.mean() if recent_prices.mean() > 0 else 0
+            close = historical_data['close'].to_numpy(dtype=np.float64)
+            _, recent_mean, recent_std = _nan_mean_std(close[-5:])
+            price_cv = recent_std / recent_mean if recent_mean > 0 else 0
             stability_factor = max(0.8, min(1.2, 1 - price_cv))
             base_concentration *= stability_factor
         
@@ -275,7 +425,7 @@ class ChipConcentrationCalculator:
         profit_ratio = 0.5  # Default neutral
         if len(historical_data) >= 10:
             # Compare current price to historical average
-            historical_avg = historical_data.tail(30)['close'].mean()
+            _, historical_avg, _ = _nan_mean_std(close[-30:])
             if historical_avg > 0:
                 profit_ratio = min(0.9, max(0.1, current_price / historical_avg - 0.5 + 0.5))
         
@@ -288,6 +438,169 @@ class ChipConcentrationCalculator:
             'calculation_method': 'fallback_improved'
         }
 
+@lru_cache(maxsize=32)
+def _decay_table(decay_factor: float, size: int) -> np.ndarray:
+    """Read-only decay weights shared across calculators with the same factor."""
+    table = decay_factor ** (np.arange(size, dtype=np.float64) / 30)
+    table.setflags(write=False)
+    return table
+
+
+def _nan_mean_std(values: np.ndarray) -> Tuple[int, float, float]:
+    """
+    NaN-skipping (count, mean, sample std) on an ndarray, matching pandas
+    Series.mean()/std(): mean is NaN when empty, std is NaN below 2 values.
+    """
+    values = values[~np.isnan(values)]
+    count = len(values)
+    mean = values.mean() if count else np.nan
+    std = np.sqrt(np.var(values, ddof=1)) if count > 1 else np.nan
+    return count, mean, std
+
+
+@njit(cache=True)
+def _clamp(x, lo, hi):
+    """max(lo, min(hi, x)) with the same NaN behaviour as the builtins."""
+    x = x if x < hi else hi
+    return x if x > lo else lo
+
+
+@njit(cache=True, error_model='numpy')
+def _chip_metrics_kernel(close, volume, days_ago, turnover, current_price, decay_table):
+    """
+    Chip metrics for one stock with at least 5 records.
+    
+    Mirrors the pandas path of ChipConcentrationCalculator.calculate_chip_concentration
+    and returns (chip_concentration, concentration_index, profit_ratio,
+    chip_stability, turnover_concentration).
+    """
+    n = len(close)
+    
+    # Per-record bucket code (1% / cent buckets) and decayed volume, computed once;
+    # unusable records keep a zero weight
+    codes = np.zeros(n, dtype=np.int64)
+    weights = np.zeros(n)
+    n_valid = 0
+    bucket_min = 0
+    bucket_max = 0
+    for i in range(n):
+        if (np.isfinite(close[i]) and np.isfinite(volume[i]) and np.isfinite(days_ago[i])
+                and close[i] > 0 and volume[i] > 0):
+            codes[i] = np.int64(np.rint(close[i] * 100))
+            weights[i] = volume[i] * decay_table[np.int64(days_ago[i])]
+            if n_valid == 0 or codes[i] < bucket_min:
+                bucket_min = codes[i]
+            if n_valid == 0 or codes[i] > bucket_max:
+                bucket_max = codes[i]
+            n_valid += 1
+    
+    concentration_index = 0.5
+    profit_ratio = 0.5
+    if n_valid > 0:
+        # Cost distribution histogram over the occupied cent range, kept in
+        # float32 to halve its footprint; totals and the Gini terms stay float64
+        hist = np.zeros(bucket_max - bucket_min + 1, dtype=np.float32)
+        # Branch-free scatter: unusable records add their zero weight to bucket 0
+        for i in range(n):
+            hist[max(codes[i] - bucket_min, 0)] += weights[i]
+        
+        total = 0.0
+        n_buckets = 0
+        for b in range(len(hist)):
+            if hist[b] > 0:
+                total += hist[b]
+                n_buckets += 1
+        
+        volumes = np.empty(n_buckets)
+        profitable = 0.0
+        k = 0
+        for b in range(len(hist)):
+            if hist[b] > 0:
+                volumes[k] = hist[b]
+                if (bucket_min + b) / 100 < current_price:
+                    profitable += volumes[k]
+                k += 1
+        
+        # Gini-style concentration index, same formula as _calculate_concentration_index
+        volumes.sort()
+        cumsum = np.cumsum(volumes)
+        weighted = 0.0
+        for i in range(n_buckets):
+            weighted += (n_buckets + 1 - i) * cumsum[i]
+        concentration_index = _clamp((n_buckets + 1 - 2 * weighted / total) / n_buckets, 0.0, 1.0)
+        
+        # Normalize once here instead of per bucket
+        if total != 0:
+            profit_ratio = profitable / total
+    
+    # Chip stability from turnover coefficient of variation (NaN skipped, ddof=1)
+    count = 0
+    turnover_sum = 0.0
+    for i in range(n):
+        if not np.isnan(turnover[i]):
+            count += 1
+            turnover_sum += turnover[i]
+    turnover_mean = turnover_sum / count if count > 0 else np.nan
+    
+    chip_stability = 0.5
+    if count > 0 and turnover_mean != 0:
+        std = np.nan
+        if count > 1:
+            squares = 0.0
+            for i in range(n):
+                if not np.isnan(turnover[i]):
+                    squares += (turnover[i] - turnover_mean) ** 2
+            std = np.sqrt(squares / (count - 1))
+        chip_stability = _clamp(1 / (1 + std / turnover_mean), 0.0, 1.0)
+    
+    # Turnover concentration: last 5 records against the whole window
+    turnover_concentration = 0.5
+    if turnover_mean != 0:
+        recent_count = 0
+        recent_sum = 0.0
+        for i in range(n - 5, n):
+            if not np.isnan(turnover[i]):
+                recent_count += 1
+                recent_sum += turnover[i]
+        recent_mean = recent_sum / recent_count if recent_count > 0 else np.nan
+        ratio = recent_mean / turnover_mean * 0.4
+        ratio = ratio if ratio > 0.1 else 0.1
+        turnover_concentration = ratio if ratio < 1.0 else 1.0
+    
+    final_concentration = _clamp(
+        concentration_index * 0.5 + chip_stability * 0.3 + turnover_concentration * 0.2, 0.0, 1.0)
+    
+    return final_concentration, concentration_index, profit_ratio, chip_stability, turnover_concentration
+
+
+@njit(parallel=True, cache=True)
+def _chip_batch_kernel(offsets, close, volume, days_ago, turnover, current_prices, decay_table, out):
+    """
+    Chip metrics over CSR-packed history (rows offsets[s]:offsets[s+1]).
+    
+    Stocks are independent, so they run in prange; out has one row per metric
+    in _chip_metrics_kernel order and one column per stock.
+    """
+    for s in prange(len(offsets) - 1):
+        lo = offsets[s]
+        hi = offsets[s + 1]
+        metrics = _chip_metrics_kernel(close[lo:hi], volume[lo:hi], days_ago[lo:hi], turnover[lo:hi],
+                                       current_prices[s], decay_table)
+        for m in range(5):
+            out[m, s] = metrics[m]
+
+
+def _unpack_stock_data(stock_data: Dict):
+    """Return (current_price, historical DataFrame) from a stock data dict."""
+    current_price = stock_data.get('close', stock_data.get('price', 0))
+    historical_data = stock_data.get('historical_data', pd.DataFrame())
+    
+    if isinstance(historical_data, list):
+        historical_data = pd.DataFrame(historical_data)
+    
+    return current_price, historical_data
+
+
 def calculate_chip_metrics_batch(stocks_data: List[Dict]) -> List[Dict]:
     """
     Calculate chip concentration metrics for multiple stocks in batch.
@@ -299,15 +612,25 @@ def calculate_chip_metrics_batch(stocks_data: List[Dict]) -> List[Dict]:
         List of dicts with chip metrics added
     """
     calculator = ChipConcentrationCalculator()
+    
+    if NUMBA_AVAILABLE:
+        try:
+            prices, frames = zip(*map(_unpack_stock_data, stocks_data)) if stocks_data else ((), ())
+            metrics = calculator.calculate_chip_concentration_batch(list(prices), list(frames))
+            results = []
+            for stock_data, chip_metrics in zip(stocks_data, metrics):
+                result = stock_data.copy()
+                result.update(chip_metrics)
+                results.append(result)
+            return results
+        except Exception as e:
+            logger.warning(f"Batch chip calculation failed: {e}, falling back to per-stock calculation")
+    
     results = []
     
     for stock_data in stocks_data:
         try:
-            current_price = stock_data.get('close', stock_data.get('price', 0))
-            historical_data = stock_data.get('historical_data', pd.DataFrame())
-            
-            if isinstance(historical_data, list):
-                historical_data = pd.DataFrame(historical_data)
+            current_price, historical_data = _unpack_stock_data(stock_data)
             
             chip_metrics = calculator.calculate_chip_concentration(current_price, historical_data)
             
@@ -327,4 +650,60 @@ def calculate_chip_metrics_batch(stocks_data: List[Dict]) -> List[Dict]:
             })
             results.append(result)
     
-    return results
\ No newline at end of file
+    return results
+
+
+def calculate_chip_metrics_batch_soa(all_history: pd.DataFrame,
+                                     current_prices: pd.Series) -> pd.DataFrame:
+    """
+    Calculate chip concentration metrics for many stocks from one long-format frame.
+    
+    Columns are converted to NumPy once for the whole universe and the stocks are
+    evaluated back to back (by the parallel kernel when numba is available), instead
+    of building one DataFrame and dict per stock.
+    
+    Args:
+        all_history: Historical rows of all stocks with columns
+                     ['symbol', 'date', 'close', 'volume', 'turnover_rate']
+        current_prices: Current price of each stock, indexed by symbol
+        
+    Returns:
+        DataFrame indexed by symbol with one column per chip metric
+    """
+    calculator = ChipConcentrationCalculator()
+    all_history = all_history[all_history['symbol'].notna()]
+    
+    # Group rows by symbol with a stable sort so each stock keeps its row order
+    codes, symbols = pd.factorize(all_history['symbol'])
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    history = all_history.iloc[order]
+    counts = np.bincount(codes, minlength=len(symbols))
+    offsets = np.zeros(len(symbols) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    
+    dates = history['date']
+    days_ago = (dates.groupby(codes).transform('max') - dates).dt.days.to_numpy(dtype=np.float64)
+    close = history['close'].to_numpy(dtype=np.float64)
+    volume = history['volume'].to_numpy(dtype=np.float64)
+    turnover = history['turnover_rate'].to_numpy(dtype=np.float64)
+    prices = current_prices.reindex(symbols).to_numpy(dtype=np.float64)
+    
+    # Stocks with fewer than 5 records use the simple fallback, like the per-stock path
+    enough = counts >= 5
+    packed = np.flatnonzero(enough)
+    rows = np.repeat(enough, counts)
+    packed_offsets = np.zeros(len(packed) + 1, dtype=np.int64)
+    np.cumsum(counts[packed], out=packed_offsets[1:])
+    
+    outputs = calculator._calculate_packed(packed_offsets, prices[packed], close[rows],
+                                           volume[rows], days_ago[rows], turnover[rows])
+    
+    metrics = [None] * len(symbols)
+    for s, packed_metrics in zip(packed, calculator._format_metrics(outputs)):
+        metrics[s] = packed_metrics
+    for s in np.flatnonzero(~enough):
+        metrics[s] = calculator._fallback_calculation(
+            prices[s], history.iloc[offsets[s]:offsets[s + 1]])
+    
+    return pd.DataFrame(metrics, index=pd.Index(symbols, name='symbol'))
@@ -9,7 +9,7 @@ from datetime import datetime, date, timedelta
 from typing import Optional
 
 from database.operations import DatabaseOperations
-from .tushare_client import TushareClient
+from .tushare_client import get_tushare_client
 from .strategy_engine import StrategyEngine
 
 logger = logging.getLogger(__name__)
@@ -19,7 +19,7 @@ class StrategyScheduler:
     
     def __init__(self):
         self.db = DatabaseOperations()
-        self.tushare = TushareClient()
+        self.tushare = get_tushare_client()
         self.strategy_engine = StrategyEngine()
         self.is_running = False
     
@@ -77,15 +77,8 @@ class StrategyScheduler:
             stocks = await self.tushare.get_stock_basic()
             
             if stocks:
-                # 分批插入，每次500条
-                batch_size = 500
-                for i in range(0, len(stocks), batch_size):
-                    batch = stocks[i:i + batch_size]
-                    await self.db.insert_stocks(batch)
-                    
-                    # 避免数据库负载过大
-                    if i + batch_size < len(stocks):
-                        await asyncio.sleep(0.1)
+                # 一次性批量写入，insert_stocks 内部使用 executemany
+                await self.db.insert_stocks(stocks)
                 
                 logger.info(f"股票基础信息更新完成，共 {len(stocks)} 条")
             else:
@@ -101,16 +94,17 @@ class StrategyScheduler:
             trade_date_str = self.tushare.get_trade_date_str(trade_date)
             logger.info(f"开始更新市场数据: {trade_date_str}")
             
-            # 更新日线数据
-            logger.info("更新日线数据...")
-            daily_data = await self.tushare.get_daily_data(trade_date=trade_date_str)
+            # 日线与基本面数据互不依赖，并发获取（频率控制由客户端统一处理）
+            logger.info("更新日线数据和每日基本面数据...")
+            daily_data, basic_data = await asyncio.gather(
+                self.tushare.get_daily_data(trade_date=trade_date_str),
+                self.tushare.get_daily_basic(trade_date=trade_date_str),
+            )
+            
             if daily_data:
                 await self.db.insert_daily_data(daily_data)
                 logger.info(f"日线数据更新完成，共 {len(daily_data)} 条")
             
-            # 更新每日基本面数据
-            logger.info("更新每日基本面数据...")
-            basic_data = await self.tushare.get_daily_basic(trade_date=trade_date_str)
             if basic_data:
                 await self.db.insert_daily_basic(basic_data)
                 logger.info(f"每日基本面数据更新完成，共 {len(basic_data)} 条")
@@ -125,37 +119,39 @@ class StrategyScheduler:
             trade_date_str = self.tushare.get_trade_date_str(trade_date)
             logger.info(f"开始更新专项数据: {trade_date_str}")
             
-            # 更新涨跌停数据
-            try:
-                logger.info("更新涨跌停数据...")
-                limit_data = await self.tushare.get_limit_list(trade_date_str)
-                if limit_data:
-                    # 这里需要实现 insert_limit_list 方法
-                    logger.info(f"涨跌停数据更新完成，共 {len(limit_data)} 条")
-            except Exception as e:
-                logger.warning(f"更新涨跌停数据失败: {e}")
-            
-            # 更新龙虎榜数据
-            try:
-                logger.info("更新龙虎榜数据...")
-                top_list_data = await self.tushare.get_top_list(trade_date_str)
-                if top_list_data:
-                    # 这里需要实现 insert_top_list 方法
-                    logger.info(f"龙虎榜数据更新完成，共 {len(top_list_data)} 条")
-                
-                # 更新龙虎榜机构数据
-                top_inst_data = await self.tushare.get_top_inst(trade_date_str)
-                if top_inst_data:
-                    # 这里需要实现 insert_top_inst 方法
-                    logger.info(f"龙虎榜机构数据更新完成，共 {len(top_inst_data)} 条")
-            except Exception as e:
-                logger.warning(f"更新龙虎榜数据失败: {e}")
+            # 涨跌停、龙虎榜、龙虎榜机构数据互不依赖，并发获取，单项失败不影响其他数据
+            logger.info("更新涨跌停和龙虎榜数据...")
+            limit_data, top_list_data, top_inst_data = await asyncio.gather(
+                self.tushare.get_limit_list(trade_date_str),
+                self.tushare.get_top_list(trade_date_str),
+                self.tushare.get_top_inst(trade_date_str),
+                return_exceptions=True
+            )
+            
+            if isinstance(limit_data, Exception):
+                logger.warning(f"更新涨跌停数据失败: {limit_data}")
+                limit_data = []
+            elif limit_data:
+                # 这里需要实现 insert_limit_list 方法
+                logger.info(f"涨跌停数据更新完成，共 {len(limit_data)} 条")
+            
+            if isinstance(top_list_data, Exception):
+                logger.warning(f"更新龙虎榜数据失败: {top_list_data}")
+            elif top_list_data:
+                # 这里需要实现 insert_top_list 方法
+                logger.info(f"龙虎榜数据更新完成，共 {len(top_list_data)} 条")
+            
+            if isinstance(top_inst_data, Exception):
+                logger.warning(f"更新龙虎榜机构数据失败: {top_inst_data}")
+            elif top_inst_data:
+                # 这里需要实现 insert_top_inst 方法
+                logger.info(f"龙虎榜机构数据更新完成，共 {len(top_inst_data)} 条")
             
             # 更新资金流向数据(只更新有涨停的股票)
             try:
                 logger.info("更新资金流向数据...")
                 # 获取当日有涨停的股票代码
-                limit_stocks = [data.ts_code for data in limit_data if data.limit == 'U'] if 'limit_data' in locals() else []
+                limit_stocks = [data.ts_code for data in limit_data if data.limit == 'U']
                 
                 if limit_stocks:
                     money_flow_data = await self.tushare.get_money_flow(trade_date_str, limit_stocks)
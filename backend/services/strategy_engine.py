@@ -3,18 +3,81 @@
 实现完整的连续涨停板选股策略逻辑
 """
 
+import asyncio
+import functools
 import logging
+import re
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from database.operations import DatabaseOperations
 from services.tushare_service import TushareService
 from config import settings, StrategyWeights
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba为可选依赖，未安装时综合评分走NumPy向量化计算
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
+# 策略用到的日线列，其余行情列（开高低、成交量等）合并前即丢弃
+STRATEGY_DAILY_COLUMNS = ('ts_code', 'name', 'close', 'pct_chg', 'amount')
+
+# 合并后需要以0填充空值的数值列（日线行情 + 基本面/资金流向/龙虎榜合并列）
+MERGED_NUMERIC_COLUMNS = (
+    'close', 'pct_chg', 'amount',
+    'turnover_rate', 'volume_ratio', 'circ_mv', 'net_inflow', 'net_amount', 'net_rate'
+)
+
+# 题材评分时并发请求概念数据的上限
+CONCEPT_FETCH_CONCURRENCY = 8
+
+# 筹码计算批量获取历史数据回溯的自然日数（覆盖60个交易日）
+CHIP_HISTORY_CALENDAR_DAYS = 120
+# 简化集中度低于 阈值×该比例 的股票不再获取历史数据走高级算法
+CHIP_PREGATE_RATIO = 0.8
+
+# 综合评分输出CandidateStock时按此顺序取列
+CANDIDATE_COLUMNS = (
+    'ts_code', 'name', 'close', 'pct_chg', 'turnover_rate', 'volume_ratio', 'total_score',
+    'circ_mv', 'amount', 'theme', 'chip_concentration', 'dragon_tiger_net_amount',
+    'volume_price_score', 'chip_score', 'dragon_tiger_score', 'theme_score', 'money_flow_score'
+)
+
+# 热门题材关键词及热度分数（按优先顺序排列）
+HOT_THEMES = {
+    'AI人工智能': 90,
+    '新能源': 85,
+    '半导体': 80,
+    '5G通信': 75,
+    '医药生物': 70,
+    '新材料': 65,
+    '光伏': 80,
+    '储能': 75,
+    '汽车': 60
+}
+
+# 所有关键词编译为一个正则，一次C层扫描即可判断是否命中任一题材
+_THEME_PATTERN = re.compile('|'.join(map(re.escape, HOT_THEMES)))
+
+# 股票概念缓存 ts_code -> (过期时间, 概念列表)，概念归属变化很少，进程内共享；
+# 按最近使用顺序淘汰，过期后重新获取
+_concept_cache: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+CONCEPT_CACHE_MAX = 8192
+CONCEPT_CACHE_TTL = 24 * 3600
+
 @dataclass
 class CandidateStock:
     """候选股票数据结构"""
@@ -65,12 +128,14 @@ class StrategyEngine:
         logger.info(f"开始运行{trade_date}的选股策略")
         
         try:
-            # 1. 获取基础数据
-            daily_data = await self.tushare.get_daily_data(trade_date)
-            daily_basic = await self.tushare.get_daily_basic(trade_date)
-            limit_list = await self.tushare.get_limit_list(trade_date)
-            money_flow = await self.tushare.get_money_flow(trade_date)
-            top_list = await self.tushare.get_top_list(trade_date)
+            # 1. 获取基础数据（各接口互不依赖，并发请求）
+            daily_data, daily_basic, limit_list, money_flow, top_list = await asyncio.gather(
+                self.tushare.get_daily_data(trade_date),
+                self.tushare.get_daily_basic(trade_date),
+                self.tushare.get_limit_list(trade_date),
+                self.tushare.get_money_flow(trade_date),
+                self.tushare.get_top_list(trade_date)
+            )
             
             if daily_data.empty:
                 logger.warning(f"{trade_date}无交易数据")
@@ -115,40 +180,35 @@ class StrategyEngine:
                    money_flow: pd.DataFrame, top_list: pd.DataFrame) -> pd.DataFrame:
         """合并各类数据"""
         try:
-            # 以日线数据为基础
-            merged = daily_data.copy()
+            # 以日线数据为基础，只保留策略用到的列，后续每一步筛选复制的数据量随之减少
+            # ts_code 设为索引后各表按索引对齐 join，合并结束再还原为普通列
+            merged = daily_data[[col for col in STRATEGY_DAILY_COLUMNS if col in daily_data.columns]]
+            merged = merged.set_index('ts_code')
             
             # 合并基本面数据
             if not daily_basic.empty:
-                merged = merged.merge(
-                    daily_basic[['ts_code', 'turnover_rate', 'volume_ratio', 'circ_mv']],
-                    on='ts_code',
-                    how='left'
+                merged = _attach_by_code(
+                    merged, daily_basic.set_index('ts_code')[['turnover_rate', 'volume_ratio', 'circ_mv']]
                 )
             
             # 合并资金流向数据
             if not money_flow.empty:
-                # 计算主力净流入
-                money_flow['net_inflow'] = (
-                    money_flow['buy_lg_amount'] + money_flow['buy_elg_amount'] -
-                    money_flow['sell_lg_amount'] - money_flow['sell_elg_amount']
-                )
-                merged = merged.merge(
-                    money_flow[['ts_code', 'net_inflow']],
-                    on='ts_code',
-                    how='left'
-                )
+                # 计算主力净流入：在一个数组上原地加减，不产生中间临时数组
+                flow = money_flow.set_index('ts_code')
+                net_inflow = flow['buy_lg_amount'].to_numpy(dtype=np.float64, copy=True)
+                net_inflow += flow['buy_elg_amount'].to_numpy(dtype=np.float64)
+                net_inflow -= flow['sell_lg_amount'].to_numpy(dtype=np.float64)
+                net_inflow -= flow['sell_elg_amount'].to_numpy(dtype=np.float64)
+                merged = _attach_by_code(merged, pd.DataFrame({'net_inflow': net_inflow}, index=flow.index))
             
             # 合并龙虎榜数据
             if not top_list.empty:
-                merged = merged.merge(
-                    top_list[['ts_code', 'net_amount', 'net_rate']],
-                    on='ts_code',
-                    how='left'
-                )
+                merged = _attach_by_code(merged, top_list.set_index('ts_code')[['net_amount', 'net_rate']])
             
-            # 填充空值
-            merged = merged.fillna(0)
+            merged = merged.reset_index()
+            
+            # 只对数值列填充空值，不改写ts_code等字符串列，也不生成新的DataFrame
+            merged.fillna({col: 0 for col in MERGED_NUMERIC_COLUMNS if col in merged.columns}, inplace=True)
             
             logger.info(f"数据合并完成，共{len(merged)}条记录")
             return merged
@@ -160,20 +220,27 @@ class StrategyEngine:
     def _initial_screening(self, data: pd.DataFrame) -> pd.DataFrame:
         """候选股初筛"""
         try:
-            # 1. 流通市值筛选（小于50亿）
-            data = data[data['circ_mv'] <= settings.max_market_cap * 10000]  # 万元转换
-            
-            # 2. 股价筛选（小于30元）
-            data = data[data['close'] <= settings.max_stock_price]
-            
-            # 3. 排除ST股票（股票代码规则筛选）
-            data = data[~data['ts_code'].str.contains('ST|\*ST', na=False)]
-            
-            # 4. 涨幅筛选（大于等于9%）
-            data = data[data['pct_chg'] >= settings.min_daily_gain]
-            
-            # 5. 排除停牌股票（成交额为0）
-            data = data[data['amount'] > 0]
+            # ST标记（含*ST）只出现在股票名称中，股票代码（如000001.SZ）不含ST，无需扫描；
+            # 用普通子串匹配，无需正则。数据不带名称列时无法识别ST
+            if 'name' in data.columns:
+                is_st = data['name'].str.contains('ST', regex=False, na=False).to_numpy()
+            else:
+                is_st = np.zeros(len(data), dtype=bool)
+            
+            # 各条件合成一个布尔掩码，只做一次行筛选和复制
+            mask = (
+                # 1. 流通市值筛选（小于50亿）
+                (data['circ_mv'] <= settings.max_market_cap * 10000) &  # 万元转换
+                # 2. 股价筛选（小于30元）
+                (data['close'] <= settings.max_stock_price) &
+                # 3. 排除ST股票
+                ~is_st &
+                # 4. 涨幅筛选（大于等于9%）
+                (data['pct_chg'] >= settings.min_daily_gain) &
+                # 5. 排除停牌股票（成交额为0）
+                (data['amount'] > 0)
+            )
+            data = data[mask]
             
             logger.info(f"初筛完成，剩余{len(data)}只股票")
             return data
@@ -185,14 +252,16 @@ class StrategyEngine:
     def _volume_price_filter(self, data: pd.DataFrame) -> pd.DataFrame:
         """量价关系过滤"""
         try:
-            # 1. 量比筛选（大于2倍）
-            data = data[data['volume_ratio'] >= settings.min_volume_ratio]
-            
-            # 2. 换手率筛选（大于等于10%）
-            data = data[data['turnover_rate'] >= settings.min_turnover_rate]
+            # 固定阈值的两个条件合成一个掩码，只做一次行筛选
+            data = data[
+                # 1. 量比筛选（大于2倍）
+                (data['volume_ratio'] >= settings.min_volume_ratio) &
+                # 2. 换手率筛选（大于等于10%）
+                (data['turnover_rate'] >= settings.min_turnover_rate)
+            ]
             
             # 3. 成交量异常放大（量比排序取前50%）
-            volume_threshold = data['volume_ratio'].quantile(0.5)
+            volume_threshold = _quantile(data['volume_ratio'], 0.5)
             data = data[data['volume_ratio'] >= volume_threshold]
             
             logger.info(f"量价过滤完成，剩余{len(data)}只股票")
@@ -215,7 +284,7 @@ class StrategyEngine:
             )
             
             # 3. 技术评分排序，取前70%
-            tech_threshold = data['technical_score'].quantile(0.3)
+            tech_threshold = _quantile(data['technical_score'], 0.3)
             data = data[data['technical_score'] >= tech_threshold]
             
             logger.info(f"技术筛选完成，剩余{len(data)}只股票")
@@ -231,44 +300,54 @@ class StrategyEngine:
             from .chip_concentration_calculator import ChipConcentrationCalculator
             
             calculator = ChipConcentrationCalculator()
-            chip_scores = []
-            profit_ratios = []
             
-            for _, row in data.iterrows():
+            # 先对全部股票按列计算改进的简化算法，作为默认值和后备
+            chip_scores, profit_ratios = self._calculate_improved_simple_concentration(data)
+            
+            # 预筛：简化算法集中度明显低于阈值的股票不再获取历史数据，直接沿用简化结果
+            # （低于阈值，最终会被筛掉），只对其余股票走高级算法
+            concentration_threshold = settings.chip_concentration_threshold
+            gate = chip_scores >= concentration_threshold * CHIP_PREGATE_RATIO
+            
+            # 通过预筛的候选股历史数据一次批量获取，再按股票取用
+            histories = await self._get_historical_data_batch(
+                list(dict.fromkeys(data['ts_code'].to_numpy()[gate])), trade_date
+            )
+            no_history = pd.DataFrame()
+            
+            # 历史数据足够（>=5天）的股票交给高级算法批量计算，
+            # 获利盘等指标由计算器的编译核函数一次算出
+            positions, prices, histories_list = [], [], []
+            for i, (ts_code, current_price) in enumerate(zip(data['ts_code'], data['close'])):
+                if not gate[i]:
+                    continue
+                historical_data = histories.get(ts_code, no_history)
+                if len(historical_data) >= 5:
+                    positions.append(i)
+                    prices.append(current_price)
+                    histories_list.append(historical_data)
+            
+            if positions:
                 try:
-                    # 获取历史数据进行高级计算
-                    ts_code = row.get('ts_code', '')
-                    current_price = row.get('close', 0)
-                    
-                    # 尝试获取历史数据
-                    historical_data = await self._get_historical_data_for_chip_calc(ts_code, trade_date)
-                    
-                    if len(historical_data) >= 5:
-                        # 使用高级算法
-                        chip_metrics = calculator.calculate_chip_concentration(current_price, historical_data)
-                        concentration = chip_metrics['chip_concentration']
-                        profit_ratio = chip_metrics['profit_ratio']
-                        
-                        logger.debug(f"高级算法计算 {ts_code}: 集中度={concentration:.3f}, 获利盘={profit_ratio:.3f}")
-                    else:
-                        # 使用改进的简化算法
-                        concentration, profit_ratio = self._calculate_improved_simple_concentration(row)
-                        logger.debug(f"简化算法计算 {ts_code}: 集中度={concentration:.3f}, 获利盘={profit_ratio:.3f}")
-                    
+                    # 批量计算是CPU密集的同步调用，放到线程池执行，不阻塞事件循环
+                    loop = asyncio.get_running_loop()
+                    metrics_list = await loop.run_in_executor(
+                        None, calculator.calculate_chip_concentration_batch, prices, histories_list
+                    )
+                    for i, chip_metrics in zip(positions, metrics_list):
+                        chip_scores[i] = chip_metrics['chip_concentration']
+                        profit_ratios[i] = chip_metrics['profit_ratio']
+                    logger.debug(f"高级算法计算{len(positions)}只股票")
                 except Exception as e:
-                    logger.warning(f"股票 {row.get('ts_code', 'unknown')} 筹码计算失败: {e}")
-                    # 使用改进的简化算法作为后备
-                    concentration, profit_ratio = self._calculate_improved_simple_concentration(row)
-                
-                chip_scores.append(concentration)
-                profit_ratios.append(profit_ratio)
+                    # 保留简化算法的结果作为后备
+                    logger.warning(f"批量筹码计算失败: {e}")
             
             # 添加计算结果到数据框
             data['chip_concentration'] = chip_scores
             data['profit_ratio'] = profit_ratios
             
             # 双重筛选：筹码集中度 AND 获利盘比例
-            concentration_filter = data['chip_concentration'] >= settings.chip_concentration_threshold
+            concentration_filter = data['chip_concentration'] >= concentration_threshold
             profit_ratio_threshold = getattr(settings, 'profit_ratio_threshold', 0.5)
             profit_filter = data['profit_ratio'] >= profit_ratio_threshold
             
@@ -277,7 +356,7 @@ class StrategyEngine:
             filtered_data = data[combined_filter]
             
             logger.info(f"筹码集中度计算完成：")
-            logger.info(f"  - 集中度 >= {settings.chip_concentration_threshold}: {concentration_filter.sum()}只")
+            logger.info(f"  - 集中度 >= {concentration_threshold}: {concentration_filter.sum()}只")
             logger.info(f"  - 获利盘 >= {profit_ratio_threshold}: {profit_filter.sum()}只")
             logger.info(f"  - 双重条件筛选后剩余: {len(filtered_data)}只股票")
             
@@ -287,11 +366,11 @@ class StrategyEngine:
             logger.error(f"筹码集中度计算失败: {e}")
             raise
     
-    def _calculate_improved_simple_concentration(self, row: pd.Series) -> tuple[float, float]:
-        """改进的简化筹码集中度计算"""
-        turnover_rate = row.get('turnover_rate', 5.0)
-        volume_ratio = row.get('volume_ratio', 1.0)
-        pct_chg = row.get('pct_chg', 0.0)
+    def _calculate_improved_simple_concentration(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """改进的简化筹码集中度计算（按列批量计算）"""
+        turnover_rate = data['turnover_rate'].to_numpy(dtype=np.float64)
+        volume_ratio = data['volume_ratio'].to_numpy(dtype=np.float64)
+        pct_chg = data['pct_chg'].to_numpy(dtype=np.float64)
         
         # 改进的集中度计算
         # 基础集中度：适度换手率表示筹码流动但不过度分散
@@ -299,88 +378,86 @@ class StrategyEngine:
         
         # 换手率因子：过高过低都不好
         optimal_turnover = 8.0  # 理想换手率
-        turnover_factor = 1.0 - abs(turnover_rate - optimal_turnover) / 20.0
-        turnover_factor = max(0.3, min(1.2, turnover_factor))
+        turnover_factor = np.clip(1.0 - np.abs(turnover_rate - optimal_turnover) / 20.0, 0.3, 1.2)
         
         # 量比因子：适度放量表示有资金介入
-        volume_factor = min(1.3, max(0.7, 0.8 + volume_ratio / 10))
+        volume_factor = np.clip(0.8 + volume_ratio / 10, 0.7, 1.3)
         
         # 涨幅因子：适度上涨配合集中度
-        price_factor = 1.0
-        if 2 <= pct_chg <= 8:  # 适度上涨
-            price_factor = 1.1
-        elif pct_chg > 9:  # 涨停附近
-            price_factor = 1.2
-        elif pct_chg < -3:  # 下跌过多
-            price_factor = 0.9
+        price_factor = np.select(
+            [(pct_chg >= 2) & (pct_chg <= 8),  # 适度上涨
+             pct_chg > 9,                      # 涨停附近
+             pct_chg < -3],                    # 下跌过多
+            [1.1, 1.2, 0.9],
+            default=1.0
+        )
         
         # 综合计算集中度
         concentration = base_concentration * turnover_factor * volume_factor * price_factor
-        concentration = max(0.2, min(0.95, concentration))
+        concentration = np.clip(concentration, 0.2, 0.95)
         
         # 获利盘估算：基于涨幅和趋势
-        profit_ratio = 0.5  # 基础50%
-        if pct_chg > 0:
-            profit_ratio += min(0.3, pct_chg / 30)  # 上涨增加获利盘
-        else:
-            profit_ratio += max(-0.3, pct_chg / 20)  # 下跌减少获利盘
-        
-        profit_ratio = max(0.1, min(0.9, profit_ratio))
+        profit_ratio = 0.5 + np.where(
+            pct_chg > 0,
+            np.minimum(0.3, pct_chg / 30),   # 上涨增加获利盘
+            np.maximum(-0.3, pct_chg / 20)   # 下跌减少获利盘
+        )
+        profit_ratio = np.clip(profit_ratio, 0.1, 0.9)
         
         return concentration, profit_ratio
     
-    async def _get_historical_data_for_chip_calc(self, ts_code: str, trade_date: str) -> pd.DataFrame:
-        """获取用于筹码计算的历史数据"""
+    async def _get_historical_data_batch(self, ts_codes: List[str], trade_date: str) -> Dict[str, pd.DataFrame]:
+        """批量获取用于筹码计算的历史数据，返回 ts_code -> 最近60天数据"""
+        if not ts_codes:
+            return {}
+        
+        # 多只股票合并为区间查询，由Tushare客户端按批拆分、并发请求并统一限频
+        end_date = trade_date.replace('-', '')
+        start_date = (pd.to_datetime(end_date) - pd.Timedelta(days=CHIP_HISTORY_CALENDAR_DAYS)).strftime('%Y%m%d')
+        
         try:
-            if not hasattr(self, 'tushare_client') or not self.tushare_client:
-                return pd.DataFrame()
-            
-            # 获取60天历史数据
-            end_date = trade_date
-            df = self.tushare_client.daily_basic(
-                ts_code=ts_code,
-                end_date=end_date,
-                fields='ts_code,trade_date,close,volume,turnover_rate'
-            )
-            
-            if df is not None and len(df) > 0:
-                df['date'] = pd.to_datetime(df['trade_date'])
-                df = df.sort_values('date')
-                return df.tail(60)  # 最近60天
-            
+            history = await self.tushare.get_daily_history(ts_codes, start_date, end_date)
         except Exception as e:
-            logger.debug(f"获取历史数据失败 {ts_code}: {e}")
+            # 获取失败时各股票沿用简化算法结果
+            logger.warning(f"批量获取历史数据失败，{len(ts_codes)}只股票使用简化算法: {e}")
+            return {}
+        
+        if history.empty:
+            return {}
+        
+        history['date'] = pd.to_datetime(history['trade_date'])
+        history = history.sort_values('date', kind='mergesort')
         
-        return pd.DataFrame()
+        # 本地按股票拆分，每只保留最近60天
+        return {
+            ts_code: group.tail(60).reset_index(drop=True)
+            for ts_code, group in history.groupby('ts_code', sort=False)
+        }
     
     def _analyze_dragon_tiger(self, data: pd.DataFrame, top_list: pd.DataFrame) -> pd.DataFrame:
         """分析龙虎榜资金"""
         try:
-            # 为所有股票初始化龙虎榜分数
-            data['dragon_tiger_score'] = 0.0
-            data['dragon_tiger_net_amount'] = 0.0
-            
-            if not top_list.empty:
-                # 合并龙虎榜数据
-                for _, row in top_list.iterrows():
-                    ts_code = row['ts_code']
-                    if ts_code in data['ts_code'].values:
-                        mask = data['ts_code'] == ts_code
-                        
-                        # 净买额评分
-                        net_amount = row.get('net_amount', 0)
-                        net_rate = row.get('net_rate', 0)
-                        
-                        # 龙虎榜评分逻辑
-                        if net_amount > 0 and net_rate > 0.1:  # 净买入且占比>10%
-                            score = min(100, net_rate * 500)  # 转换为0-100分
-                        elif net_amount < 0 and abs(net_rate) > 0.05:  # 砸盘席位>5%
-                            score = -min(50, abs(net_rate) * 1000)
-                        else:
-                            score = 0
-                        
-                        data.loc[mask, 'dragon_tiger_score'] = score
-                        data.loc[mask, 'dragon_tiger_net_amount'] = net_amount
+            if top_list.empty:
+                # 无龙虎榜数据时所有股票分数为0
+                data['dragon_tiger_score'] = 0.0
+                data['dragon_tiger_net_amount'] = 0.0
+            else:
+                # 同一股票多条上榜记录时以最后一条为准
+                top = top_list.drop_duplicates('ts_code', keep='last').set_index('ts_code')
+                net_amount = top['net_amount'].to_numpy(dtype=np.float64)
+                net_rate = top['net_rate'].to_numpy(dtype=np.float64)
+                
+                # 龙虎榜评分逻辑：净买入且占比>10%转换为0-100分，砸盘席位>5%扣分
+                buy_mask = (net_amount > 0) & (net_rate > 0.1)
+                sell_mask = (net_amount < 0) & (np.abs(net_rate) > 0.05)
+                score = np.where(buy_mask, np.minimum(100, net_rate * 500),
+                                 np.where(sell_mask, -np.minimum(50, np.abs(net_rate) * 1000), 0.0))
+                
+                # 一次哈希查找得到每只股票在龙虎榜中的位置，未上榜为-1
+                pos = top.index.get_indexer(data['ts_code'])
+                listed = pos >= 0
+                data['dragon_tiger_score'] = np.where(listed, score[pos], 0.0)
+                data['dragon_tiger_net_amount'] = np.where(listed, net_amount[pos], 0.0)
             
             logger.info(f"龙虎榜分析完成，{len(top_list)}只股票上榜")
             return data
@@ -395,54 +472,28 @@ class StrategyEngine:
             # 简化的题材评分
             # 实际应用中需要实时题材热度分析
             
-            theme_scores = []
-            themes = []
-            
-            # 定义热门题材关键词
-            hot_themes = {
-                'AI人工智能': 90,
-                '新能源': 85,
-                '半导体': 80,
-                '5G通信': 75,
-                '医药生物': 70,
-                '新材料': 65,
-                '光伏': 80,
-                '储能': 75,
-                '汽车': 60
-            }
-            
-            for _, row in data.iterrows():
-                ts_code = row['ts_code']
+            # 并发获取所有候选股的概念（去重后每只股票只请求一次）
+            codes = list(dict.fromkeys(data['ts_code']))
+            semaphore = asyncio.Semaphore(CONCEPT_FETCH_CONCURRENCY)
+            
+            async def _fetch(ts_code: str) -> List[str]:
+                async with semaphore:
+                    return await self._get_concept_detail_cached(ts_code)
+            
+            fetched = await asyncio.gather(*(_fetch(code) for code in codes), return_exceptions=True)
+            
+            # 每只股票只判定一次题材，结果放入字典后按代码整列映射
+            theme_map = {}
+            score_map = {}
+            for ts_code, concepts in zip(codes, fetched):
+                if isinstance(concepts, Exception):
+                    logger.warning(f"获取{ts_code}概念失败: {concepts}")
+                    concepts = ()
                 
-                # 获取股票概念（简化处理）
-                try:
-                    concepts = await self.tushare.get_concept_detail(ts_code)
-                    
-                    # 计算题材热度分数
-                    max_score = 0
-                    main_theme = "其他"
-                    
-                    for concept in concepts:
-                        for theme, score in hot_themes.items():
-                            if theme in concept:
-                                if score > max_score:
-                                    max_score = score
-                                    main_theme = theme
-                                break
-                    
-                    if max_score == 0:
-                        max_score = 30  # 默认分数
-                    
-                    theme_scores.append(max_score)
-                    themes.append(main_theme)
-                    
-                except Exception as e:
-                    logger.warning(f"获取{ts_code}概念失败: {e}")
-                    theme_scores.append(30)
-                    themes.append("其他")
+                theme_map[ts_code], score_map[ts_code] = _match_theme(tuple(concepts))
             
-            data['theme_score'] = theme_scores
-            data['theme'] = themes
+            data['theme_score'] = data['ts_code'].map(score_map).fillna(30)
+            data['theme'] = data['ts_code'].map(theme_map).fillna("其他")
             
             logger.info(f"题材评分完成")
             return data
@@ -451,77 +502,136 @@ class StrategyEngine:
             logger.error(f"题材评分失败: {e}")
             raise
     
+    async def _get_concept_detail_cached(self, ts_code: str) -> List[str]:
+        """
+        获取股票概念，结果在进程内缓存（LRU + 过期时间）
+        
+        只缓存取到的非空结果：请求失败（None）或返回空表（tushare在HTTP错误时也返回空表）
+        都不写入缓存，下次调用重新请求，避免一次偶发失败让该股一整天都按"其他"评分
+        """
+        entry = _concept_cache.get(ts_code)
+        if entry is not None and time.monotonic() < entry[0]:
+            _concept_cache.move_to_end(ts_code)
+            return entry[1]
+        
+        concepts = await self.tushare.get_concept_detail(ts_code)
+        if not concepts:
+            return []
+        _concept_cache[ts_code] = (time.monotonic() + CONCEPT_CACHE_TTL, concepts)
+        _concept_cache.move_to_end(ts_code)
+        if len(_concept_cache) > CONCEPT_CACHE_MAX:
+            _concept_cache.popitem(last=False)
+        return concepts
+    
     def _comprehensive_scoring(self, data: pd.DataFrame) -> List[CandidateStock]:
         """综合评分和排名"""
         try:
-            results = []
-            
-            for i, row in data.iterrows():
-                # 计算各维度分数（0-100分制）
+            has_money_flow = 'net_inflow' in data.columns
+            weights = np.array([
+                StrategyWeights.VOLUME_PRICE,
+                StrategyWeights.CHIP_CONCENTRATION,
+                StrategyWeights.DRAGON_TIGER,
+                StrategyWeights.THEME_HEAT,
+                StrategyWeights.MONEY_FLOW
+            ], dtype=np.float64)
+            
+            # 取出底层ndarray直接计算，避免Series运算的索引对齐和对象包装开销
+            volume_ratio = data['volume_ratio'].to_numpy(dtype=np.float64)
+            turnover_rate = data['turnover_rate'].to_numpy(dtype=np.float64)
+            pct_chg = data['pct_chg'].to_numpy(dtype=np.float64)
+            chip_concentration = data['chip_concentration'].to_numpy(dtype=np.float64)
+            dragon_tiger = data['dragon_tiger_score'].to_numpy(dtype=np.float64)
+            theme_score = data['theme_score'].to_numpy(dtype=np.float64)
+            if has_money_flow:
+                net_inflow = data['net_inflow'].to_numpy(dtype=np.float64)
+            else:
+                net_inflow = np.zeros(len(data))
+            
+            if NUMBA_AVAILABLE:
+                # 各维度分数与加权总分在编译核函数中一次遍历算出
+                out = np.empty((5, len(data)), dtype=np.float64)
+                _score_kernel(
+                    volume_ratio, turnover_rate, pct_chg, chip_concentration, dragon_tiger,
+                    theme_score, net_inflow, has_money_flow, weights, out
+                )
+                volume_price_score, chip_score, dragon_tiger_score, money_flow_score, total_score = out
+            else:
+                # 各维度分数按列整体计算（0-100分制）
                 
                 # 1. 量价分数 (30%)
                 volume_price_score = (
-                    min(100, row['volume_ratio'] * 20) * 0.4 +
-                    min(100, row['turnover_rate'] * 3) * 0.3 +
-                    min(100, row['pct_chg'] * 8) * 0.3
+                    np.minimum(100, volume_ratio * 20) * 0.4 +
+                    np.minimum(100, turnover_rate * 3) * 0.3 +
+                    np.minimum(100, pct_chg * 8) * 0.3
                 )
                 
                 # 2. 筹码分数 (25%)
-                chip_score = row['chip_concentration'] * 100
+                chip_score = chip_concentration * 100
                 
                 # 3. 龙虎榜分数 (20%)
-                dragon_tiger_score = max(0, min(100, row.get('dragon_tiger_score', 0)))
+                dragon_tiger_score = np.clip(dragon_tiger, 0, 100)
                 
-                # 4. 题材分数 (15%)
-                theme_score = row.get('theme_score', 30)
+                # 4. 题材分数 (15%) 直接使用theme_score
                 
                 # 5. 资金流分数 (10%)
-                net_inflow = row.get('net_inflow', 0)
-                money_flow_score = min(100, max(0, (net_inflow / 10000000 + 1) * 50))  # 千万为单位
+                if has_money_flow:
+                    money_flow_score = np.clip((net_inflow / 10000000 + 1) * 50, 0, 100)  # 千万为单位
+                else:
+                    # 无资金流向数据时净流入按0计
+                    money_flow_score = np.full(len(data), 50.0)
                 
                 # 综合评分
+                w_volume_price, w_chip, w_dragon_tiger, w_theme, w_money_flow = weights
                 total_score = (
-                    volume_price_score * StrategyWeights.VOLUME_PRICE +
-                    chip_score * StrategyWeights.CHIP_CONCENTRATION +
-                    dragon_tiger_score * StrategyWeights.DRAGON_TIGER +
-                    theme_score * StrategyWeights.THEME_HEAT +
-                    money_flow_score * StrategyWeights.MONEY_FLOW
-                )
-                
-                # 创建候选股票对象
-                candidate = CandidateStock(
-                    ts_code=row['ts_code'],
-                    name=row.get('name', ''),
-                    close=float(row['close']),
-                    pct_chg=float(row['pct_chg']),
-                    turnover_rate=float(row.get('turnover_rate', 0)),
-                    volume_ratio=float(row.get('volume_ratio', 0)),
-                    total_score=float(total_score),
-                    rank_position=0,  # 后续排序后设置
-                    reason="技术突破+量价齐升+题材热度",
-                    market_cap=float(row.get('circ_mv', 0)) / 10000,  # 转换为亿元
-                    amount=float(row.get('amount', 0)),
-                    theme=row.get('theme', '其他'),
-                    chip_concentration=float(row.get('chip_concentration', 0)),
-                    dragon_tiger_net_amount=float(row.get('dragon_tiger_net_amount', 0)),
-                    volume_price_score=float(volume_price_score),
-                    chip_score=float(chip_score),
-                    dragon_tiger_score=float(dragon_tiger_score),
-                    theme_score=float(theme_score),
-                    money_flow_score=float(money_flow_score)
+                    volume_price_score * w_volume_price +
+                    chip_score * w_chip +
+                    dragon_tiger_score * w_dragon_tiger +
+                    theme_score * w_theme +
+                    money_flow_score * w_money_flow
                 )
-                
-                results.append(candidate)
             
-            # 按评分排序
-            results.sort(key=lambda x: x.total_score, reverse=True)
-            
-            # 设置排名
-            for i, candidate in enumerate(results):
-                candidate.rank_position = i + 1
+            # 只需前50只：先在总分数组上部分选择（keep='first'同分保持原顺序），
+            # 再只对入选的行取数据、写入分数列，不复制整张表
+            top_pos = pd.Series(total_score).nlargest(50, keep='first').index.to_numpy()
+            top = data.iloc[top_pos].assign(
+                name=data['name'].iloc[top_pos] if 'name' in data.columns else '',
+                volume_price_score=volume_price_score[top_pos],
+                chip_score=chip_score[top_pos],
+                dragon_tiger_score=dragon_tiger_score[top_pos],
+                money_flow_score=money_flow_score[top_pos],
+                total_score=total_score[top_pos]
+            )
             
-            # 取前50只
-            results = results[:50]
+            # 按固定列顺序取原始元组（name=None不构造namedtuple），位置解包直接建对象
+            records = top[list(CANDIDATE_COLUMNS)].itertuples(index=False, name=None)
+            results = [
+                CandidateStock(
+                    ts_code=ts_code,
+                    name=name,
+                    close=float(close),
+                    pct_chg=float(pct_chg),
+                    turnover_rate=float(turnover_rate),
+                    volume_ratio=float(volume_ratio),
+                    total_score=float(score),
+                    rank_position=rank,
+                    reason="技术突破+量价齐升+题材热度",
+                    market_cap=float(circ_mv) / 10000,  # 转换为亿元
+                    amount=float(amount),
+                    theme=theme,
+                    chip_concentration=float(chip_concentration),
+                    dragon_tiger_net_amount=float(dragon_tiger_net_amount),
+                    volume_price_score=float(vp_score),
+                    chip_score=float(c_score),
+                    dragon_tiger_score=float(dt_score),
+                    theme_score=float(t_score),
+                    money_flow_score=float(mf_score)
+                )
+                for rank, (
+                    ts_code, name, close, pct_chg, turnover_rate, volume_ratio, score,
+                    circ_mv, amount, theme, chip_concentration, dragon_tiger_net_amount,
+                    vp_score, c_score, dt_score, t_score, mf_score
+                ) in enumerate(records, 1)
+            ]
             
             logger.info(f"综合评分完成，最终筛选出{len(results)}只候选股票")
             return results
@@ -555,15 +665,17 @@ class StrategyEngine:
             # 涨停家数
             limit_up_count = len(limit_up)
             
-            # 连板分布
-            times_dist = limit_up['times'].value_counts().to_dict()
-            times_dist = {str(k): v for k, v in times_dist.items()}
+            # 连板次数是小整数，取出一次数组后分布/连板数/均值都在同一数组上计算
+            times = limit_up['times'].dropna().to_numpy(dtype=np.int64)
+            
+            # 连板分布（按连板次数升序）
+            times_dist = {str(i): int(c) for i, c in enumerate(np.bincount(times)) if c}
             
             # 总连板股数
-            total_limit_stocks = len(limit_up[limit_up['times'] >= 2])
+            total_limit_stocks = int((times >= 2).sum())
             
             # 平均打开次数（简化计算）
-            avg_open_times = max(1.0, limit_up['times'].mean()) if not limit_up.empty else 1.0
+            avg_open_times = max(1.0, times.mean()) if times.size else 1.0
             
             # 炸板率（简化为连续板占比的逆向指标）
             zhaban_rate = 1 - (total_limit_stocks / max(1, limit_up_count))
@@ -594,3 +706,118 @@ class StrategyEngine:
                 zhaban_rate=0.0,
                 emotion_index=0.0
             )
+
+
+def _attach_by_code(merged: pd.DataFrame, side: pd.DataFrame) -> pd.DataFrame:
+    """
+    按ts_code索引把附表的列左连接到主表
+    
+    附表代码唯一时按索引直接取值写入新列，不复制主表已有列；
+    附表同一代码有多行时回退为join，保留一对多展开的结果
+    """
+    if not side.index.is_unique:
+        return merged.join(side, how='left')
+    
+    for col in side.columns:
+        merged[col] = side[col].reindex(merged.index).to_numpy()
+    return merged
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_theme(concepts: Tuple[str, ...]) -> Tuple[str, int]:
+    """按概念列表判定主题材及热度分数，未命中热门题材时为("其他", 30)"""
+    max_score = 0
+    main_theme = "其他"
+    
+    # 绝大多数股票的概念不含热门题材，整体扫描一次即可跳过逐个匹配
+    if concepts and _THEME_PATTERN.search('\n'.join(concepts)) is not None:
+        for concept in concepts:
+            if _THEME_PATTERN.search(concept) is None:
+                continue
+            # 命中时按关键词定义顺序取第一个匹配的题材
+            for theme, score in HOT_THEMES.items():
+                if theme in concept:
+                    if score > max_score:
+                        max_score = score
+                        main_theme = theme
+                    break
+    
+    if max_score == 0:
+        max_score = 30  # 默认分数
+    
+    return main_theme, max_score
+
+
+def _quantile(series: pd.Series, q: float) -> float:
+    """
+    分位数（线性插值，忽略空值），结果与Series.quantile一致
+    
+    用np.partition只选出插值所需的相邻两个元素，O(N)代替排序
+    """
+    values = series.to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values)]
+    n = values.size
+    if n == 0:
+        return np.nan
+    
+    pos = q * (n - 1)
+    k = int(pos)
+    frac = pos - k
+    if frac == 0:
+        return np.partition(values, k)[k]
+    
+    part = np.partition(values, (k, k + 1))
+    lower, upper = part[k], part[k + 1]
+    # 与NumPy线性插值的写法保持一致，保证逐位相同
+    diff = upper - lower
+    return upper - diff * (1 - frac) if frac >= 0.5 else lower + diff * frac
+
+
+@njit(cache=True)
+def _score_kernel(volume_ratio, turnover_rate, pct_chg, chip_concentration, dragon_tiger,
+                  theme_score, net_inflow, has_money_flow, weights, out):
+    """
+    综合评分核函数：逐行计算各维度分数（0-100分制）和加权总分
+    
+    out按行依次为量价、筹码、龙虎榜、资金流分数和总分，每列对应一只股票；
+    计算顺序与向量化路径一致，结果逐位相同
+    """
+    for i in range(len(volume_ratio)):
+        # 1. 量价分数
+        vr = volume_ratio[i] * 20
+        if vr > 100:
+            vr = 100.0
+        tr = turnover_rate[i] * 3
+        if tr > 100:
+            tr = 100.0
+        pc = pct_chg[i] * 8
+        if pc > 100:
+            pc = 100.0
+        vp = vr * 0.4 + tr * 0.3 + pc * 0.3
+        
+        # 2. 筹码分数
+        chip = chip_concentration[i] * 100
+        
+        # 3. 龙虎榜分数
+        dt = dragon_tiger[i]
+        if dt < 0:
+            dt = 0.0
+        elif dt > 100:
+            dt = 100.0
+        
+        # 5. 资金流分数（千万为单位，无数据时按50分）
+        if has_money_flow:
+            mf = (net_inflow[i] / 10000000 + 1) * 50
+            if mf < 0:
+                mf = 0.0
+            elif mf > 100:
+                mf = 100.0
+        else:
+            mf = 50.0
+        
+        out[0, i] = vp
+        out[1, i] = chip
+        out[2, i] = dt
+        out[3, i] = mf
+        out[4, i] = (vp * weights[0] + chip * weights[1] + dt * weights[2] +
+                     theme_score[i] * weights[3] + mf * weights[4])
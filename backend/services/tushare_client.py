@@ -5,13 +5,20 @@ Tushare API客户端
 
 import tushare as ts
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 import logging
 import asyncio
+import random
+import re
+import threading
 import time
+from collections import deque
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 import functools
+from concurrent.futures import ThreadPoolExecutor
 
 from config import settings
 from database.models import (
@@ -21,28 +28,179 @@ from database.models import (
 
 logger = logging.getLogger(__name__)
 
-def api_retry(max_retries: int = 3, delay: float = 1.0):
+# Tushare频率超限的错误信息
+_RATE_LIMIT_PAT = re.compile('每分钟最多访问|访问过于频繁')
+_RATE_LIMIT_WAIT = 60.0  # 频率超限后的等待时间(秒)
+
+# 股票列表、交易日历等准静态结果的缓存有效期(秒)
+STATIC_CACHE_TTL = 3600
+
+# 已确认DataApi.query通过模块级requests.post发请求的tushare版本（与requirements中的固定版本一致），
+# 其他版本不替换，避免依赖已变化的内部实现
+_KEEP_ALIVE_TUSHARE_VERSIONS = ('1.2.89', '1.3.12')
+
+class _ThreadLocalSessionRequests:
+    """
+    tushare.pro.client中requests模块的替身
+    
+    post走当前线程自己的keep-alive Session（requests不保证Session跨线程安全），
+    其余属性仍取自requests模块
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+    
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._local.session = session
+        return session
+    
+    def post(self, *args, **kwargs):
+        return self._session().post(*args, **kwargs)
+    
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+def _install_keep_alive_session() -> None:
+    """
+    让tushare Pro接口复用keep-alive连接
+    
+    tushare的DataApi.query直接调用模块级requests.post，每次请求都新建TCP连接；
+    在已确认的tushare版本上把其模块中的requests替换为按线程复用Session的替身。
+    版本不符或结构变化时保持原样并记录日志
+    """
+    try:
+        from tushare.pro import client as pro_client
+        if isinstance(pro_client.requests, _ThreadLocalSessionRequests):
+            return
+        version = getattr(ts, '__version__', 'unknown')
+        if version not in _KEEP_ALIVE_TUSHARE_VERSIONS or pro_client.requests is not requests:
+            logger.info(f"tushare {version} 未启用HTTP连接复用（仅支持{', '.join(_KEEP_ALIVE_TUSHARE_VERSIONS)}）")
+            return
+        pro_client.requests = _ThreadLocalSessionRequests()
+        logger.info("Tushare HTTP连接复用已启用")
+    except Exception as e:
+        logger.warning(f"启用Tushare HTTP连接复用失败，使用默认请求方式: {e}")
+
+# 可重试的异常：网络连接和超时。Tushare业务错误（权限、token、参数等）统一抛出Exception，
+# 其中只有频率超限按错误信息识别后重试，其余错误重试也不会成功，直接抛出
+_RETRYABLE_EXCEPTIONS = (requests.exceptions.RequestException, ConnectionError, TimeoutError)
+_RETRY_JITTER = 0.5  # 重试等待时间附加的随机抖动上限(秒)，避免配额恢复时并发请求同时重试
+_BREAKER_THRESHOLD = 3  # 连续多少次调用重试耗尽后熔断
+_BREAKER_COOLDOWN = 60.0  # 熔断冷却时间(秒)
+
+def api_retry(max_retries: int = 3, delay: float = 1.0, retry_exc: tuple = _RETRYABLE_EXCEPTIONS):
     """
 API调用重试装饰器
+    
+    只重试retry_exc中的异常和Tushare频率超限错误，其他异常立即抛出；
+    重试等待为指数退避加随机抖动。同一接口连续_BREAKER_THRESHOLD次调用重试耗尽后熔断，
+    冷却期内的调用直接失败
     """
     def decorator(func):
+        breaker = {'failures': 0, 'open_until': 0.0}
+        
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
+            if time.monotonic() < breaker['open_until']:
+                raise RuntimeError(f"API连续调用失败，熔断冷却中: {func.__name__}")
+            
             for attempt in range(max_retries):
                 try:
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
+                    breaker['failures'] = 0
+                    return result
                 except Exception as e:
+                    error_msg = str(e)
+                    rate_limited = bool(_RATE_LIMIT_PAT.search(error_msg))
+                    if not (rate_limited or isinstance(e, retry_exc)):
+                        logger.error(f"API调用失败（不可重试）: {func.__name__} - {error_msg}")
+                        raise
+                    
                     if attempt == max_retries - 1:
-                        logger.error(f"API调用失败，已重试{max_retries}次: {func.__name__} - {e}")
-                        raise e
+                        logger.error(f"API调用失败，已重试{max_retries}次: {func.__name__} - {error_msg}")
+                        breaker['failures'] += 1
+                        if breaker['failures'] >= _BREAKER_THRESHOLD:
+                            breaker['open_until'] = time.monotonic() + _BREAKER_COOLDOWN
+                            logger.warning(f"{func.__name__} 连续{breaker['failures']}次调用失败，熔断{_BREAKER_COOLDOWN:.0f}秒")
+                        raise
                     
-                    wait_time = delay * (2 ** attempt)
-                    logger.warning(f"API调用失败，{wait_time}秒后重试: {func.__name__} - {e}")
+                    # 触发Tushare频率限制时等待整个分钟窗口，短间隔重试只会再次被拒
+                    if rate_limited:
+                        wait_time = _RATE_LIMIT_WAIT
+                    else:
+                        wait_time = delay * (2 ** attempt)
+                    wait_time += random.uniform(0, _RETRY_JITTER)
+                    logger.warning(f"API调用失败，{wait_time:.1f}秒后重试: {func.__name__} - {error_msg}")
                     await asyncio.sleep(wait_time)
             return None
         return wrapper
     return decorator
 
+
+def _plain_values(series: pd.Series) -> list:
+    """原值列（字符串等），空值（含NaN）为None"""
+    notna = series.notna().tolist()
+    return [v if ok else None for v, ok in zip(series.tolist(), notna)]
+
+def _map_unique(series: pd.Series, convert) -> list:
+    """
+    按不同取值逐个转换后按编码取回，空值为None
+    
+    行情数据中交易日期、价格等列重复值很多（整日数据只有一个trade_date），
+    先factorize，每个不同的值只转换一次
+    """
+    codes, uniques = pd.factorize(series)
+    converted = [convert(v) for v in uniques.tolist()]
+    return [converted[k] if k >= 0 else None for k in codes.tolist()]
+
+def _decimal_values(series: pd.Series) -> List[Optional[Decimal]]:
+    """数值列转Decimal，空值为None"""
+    return _map_unique(series, lambda v: Decimal(str(v)))
+
+def _int_values(series: pd.Series) -> List[Optional[int]]:
+    """数值列转int，空值为None"""
+    notna = series.notna().tolist()
+    return [int(v) if ok else None for v, ok in zip(series.tolist(), notna)]
+
+def _date_values(series: pd.Series) -> List[Optional[date]]:
+    """日期列转date，空值为None"""
+    return _map_unique(series, lambda v: pd.to_datetime(v).date())
+
+def _time_values(series: pd.Series) -> list:
+    """时间列转time，空值为None"""
+    return _map_unique(series, lambda v: pd.to_datetime(v).time())
+
+def _build_models(model_cls, df: pd.DataFrame, converters: Dict[str, Any]) -> list:
+    """
+    按列转换DataFrame后批量构建模型
+    
+    converters为 字段名 -> 列转换函数（None表示取原值），字段名即列名；
+    每列只转换一次，再按行zip组装模型。
+    各转换函数已产出字段声明的类型（Decimal/int/date/time，空值为None），
+    因此用model_construct跳过逐字段校验
+    """
+    if df.empty:
+        return []
+    names = list(converters)
+    columns = [(converter or _plain_values)(df[name]) for name, converter in converters.items()]
+    construct = model_cls.model_construct
+    return [construct(**dict(zip(names, values))) for values in zip(*columns)]
+
+class _EndpointRateState:
+    """单个接口的调用频率状态"""
+    
+    def __init__(self, max_calls_per_minute: int):
+        self.last_call_time = float('-inf')  # time.monotonic() 时间戳
+        # 只保留最近 max_calls_per_minute 次调用时间，队首即窗口内最早的一次
+        self.call_history = deque(maxlen=max_calls_per_minute)
+        self.lock = asyncio.Lock()
+
 class TushareClient:
     """
 Tushare API客户端类
@@ -54,64 +212,169 @@ Tushare API客户端类
         self.pro = None
         self._init_client()
         
-        # API调用频率控制
-        self.last_call_time = 0
-        self.min_interval = 0.3  # 最小调用间隔(秒)
+        # 专用线程池执行同步的Tushare调用，不与默认线程池中的其他阻塞任务争用
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tushare')
+        # DataFrame转模型是持有GIL的纯CPU工作，放到单独的单线程池，不阻塞事件循环，
+        # 也不占用网络请求线程（多线程并不能加快持GIL的转换）
+        self._convert_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tushare-convert')
+        
+        # API调用频率控制，Tushare按接口分别限频，各接口独立计数，互不阻塞
+        self.min_interval = 0.3  # 同一接口的最小调用间隔(秒)
+        self.max_calls_per_minute = 200  # 同一接口每分钟调用上限
+        self._rate_states: Dict[str, _EndpointRateState] = {}
     
     def _init_client(self):
         """初始化Tushare Pro客户端"""
         try:
             ts.set_token(self.token)
             self.pro = ts.pro_api()
+            # 准静态接口结果缓存：key -> (过期时间, 结果)，重新初始化（如更换token）时清空
+            self._static_cache: Dict[Any, tuple] = {}
+            _install_keep_alive_session()
             logger.info("Tushare Pro API初始化成功")
         except Exception as e:
             logger.error(f"Tushare Pro API初始化失败: {e}")
             raise
     
-    async def _wait_for_rate_limit(self):
-        """等待API调用频率限制"""
-        current_time = time.time()
-        elapsed = current_time - self.last_call_time
-        if elapsed < self.min_interval:
-            wait_time = self.min_interval - elapsed
-            await asyncio.sleep(wait_time)
-        self.last_call_time = time.time()
+    def close(self):
+        """关闭Tushare调用和数据转换线程池"""
+        self._executor.shutdown(wait=False)
+        self._convert_executor.shutdown(wait=False)
+    
+    def _cache_get(self, key):
+        """读取未过期的缓存结果，没有则返回None"""
+        entry = self._static_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def _cache_set(self, key, value):
+        """缓存结果，STATIC_CACHE_TTL秒后过期"""
+        self._static_cache[key] = (time.monotonic() + STATIC_CACHE_TTL, value)
+    
+    async def _run(self, api, **kwargs) -> pd.DataFrame:
+        """在Tushare线程池中执行同步接口调用"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(api, **kwargs))
+    
+    async def query_dataframe(self, api_name: str, cached: bool = False, **kwargs) -> pd.DataFrame:
+        """
+        经频率控制调用任意Pro接口，返回原始DataFrame
+        
+        供需要DataFrame而非模型的调用方（如TushareService）使用，
+        与本客户端共用线程池、HTTP会话和调用频率配额。
+        cached=True用于股票列表、交易日历等准静态接口：按接口名和参数缓存非空结果
+        STATIC_CACHE_TTL秒，命中时返回副本，调用方修改结果不会影响缓存
+        """
+        cache_key = (api_name, tuple(sorted(kwargs.items()))) if cached else None
+        if cache_key is not None:
+            df = self._cache_get(cache_key)
+            if df is not None:
+                return df.copy()
+        
+        await self._wait_for_rate_limit(api_name)
+        df = await self._run(getattr(self.pro, api_name), **kwargs)
+        # tushare在HTTP错误时返回空表，空结果不缓存
+        if cache_key is not None and not df.empty:
+            self._cache_set(cache_key, df)
+            return df.copy()
+        return df
+    
+    async def query_batches(self, api_name: str, ts_codes: List[str], **kwargs) -> pd.DataFrame:
+        """
+        按股票代码分批并发调用Pro接口（每批经频率控制），返回合并后的原始DataFrame
+        
+        供需要多只股票区间数据的调用方（如TushareService）使用
+        """
+        await self._wait_for_rate_limit(api_name)
+        return await self._fetch_batches(api_name, ts_codes, **kwargs)
+    
+    async def _to_models(self, model_cls, df: pd.DataFrame, converters: Dict[str, Any]) -> list:
+        """在转换线程池中按列转换DataFrame并构建模型"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._convert_executor, _build_models, model_cls, df, converters)
+    
+    async def _wait_for_rate_limit(self, api_name: str):
+        """等待指定接口的调用频率限制"""
+        state = self._rate_states.get(api_name)
+        if state is None:
+            state = self._rate_states[api_name] = _EndpointRateState(self.max_calls_per_minute)
+        
+        # 持锁完成检查、等待和登记，同一接口的并发协程按顺序通过，不会同时读到过期的状态
+        async with state.lock:
+            current_time = time.monotonic()
+            wait_time = 0.0
+            elapsed = current_time - state.last_call_time
+            if elapsed < self.min_interval:
+                wait_time = self.min_interval - elapsed
+            
+            # 窗口已满时，等到最早一次调用滑出60秒窗口
+            if len(state.call_history) == state.call_history.maxlen:
+                window_wait = 60.0 - (current_time - state.call_history[0])
+                wait_time = max(wait_time, window_wait)
+            
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+                current_time += wait_time
+            state.last_call_time = current_time
+            state.call_history.append(current_time)
+    
+    async def _fetch_batches(self, api_name: str, ts_codes: List[str], **kwargs) -> pd.DataFrame:
+        """
+        按股票代码分批（每批50只）并发调用接口，结果按批次顺序合并
+        
+        每批调用前经过频率控制（第一批使用调用方已登记的配额），
+        线程池大小即同时在途的请求数
+        """
+        api = getattr(self.pro, api_name)
+        batches = [ts_codes[i:i + 50] for i in range(0, len(ts_codes), 50)]
+        
+        async def _fetch(index: int, batch_codes: List[str]) -> pd.DataFrame:
+            if index:
+                await self._wait_for_rate_limit(api_name)
+            return await self._run(api, ts_code=','.join(batch_codes), **kwargs)
+        
+        all_data = await asyncio.gather(*(_fetch(i, codes) for i, codes in enumerate(batches)))
+        # 空批次不参与合并，避免无谓的块分配和空表对列类型推断的干扰
+        all_data = [df for df in all_data if df is not None and not df.empty]
+        if all_data:
+            return pd.concat(all_data, ignore_index=True, sort=False)
+        return pd.DataFrame()
     
     @api_retry(max_retries=3, delay=1.0)
     async def get_stock_basic(self) -> List[StockInfo]:
-        """获取股票基础信息"""
-        await self._wait_for_rate_limit()
+        """获取股票基础信息（股票列表一天内基本不变，结果缓存STATIC_CACHE_TTL秒）"""
+        cached = self._cache_get('stock_basic')
+        if cached is not None:
+            return list(cached)
+        
+        await self._wait_for_rate_limit('stock_basic')
         
-        def _fetch_stock_basic():
+        try:
             # 主板 + 中小板 + 创业板
-            df = self.pro.stock_basic(
+            df = await self._run(
+                self.pro.stock_basic,
                 exchange='',
                 list_status='L',
                 fields='ts_code,symbol,name,area,industry,market,list_date,is_hs'
             )
-            return df
-        
-        try:
-            # 在线程池中执行同步操作
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(None, _fetch_stock_basic)
             
-            stocks = []
-            for _, row in df.iterrows():
-                stock = StockInfo(
-                    ts_code=row['ts_code'],
-                    symbol=row['symbol'],
-                    name=row['name'],
-                    area=row['area'],
-                    industry=row['industry'],
-                    market=row['market'],
-                    list_date=pd.to_datetime(row['list_date']).date() if pd.notna(row['list_date']) else None,
-                    is_hs=row['is_hs']
-                )
-                stocks.append(stock)
+            # 按列整体转换（空值为None）后批量构建模型，不再逐行判断和格式化
+            stocks = await self._to_models(StockInfo, df, {
+                'ts_code': None,
+                'symbol': None,
+                'name': None,
+                'area': None,
+                'industry': None,
+                'market': None,
+                'list_date': _date_values,
+                'is_hs': None
+            })
             
             logger.info(f"获取到 {len(stocks)} 只股票基础信息")
-            return stocks
+            if stocks:
+                self._cache_set('stock_basic', stocks)
+            return list(stocks)
             
         except Exception as e:
             logger.error(f"获取股票基础信息失败: {e}")
@@ -121,55 +384,31 @@ Tushare API客户端类
     async def get_daily_data(self, trade_date: Optional[str] = None, 
                            ts_codes: Optional[List[str]] = None) -> List[DailyData]:
         """获取日线数据"""
-        await self._wait_for_rate_limit()
+        await self._wait_for_rate_limit('daily')
         
-        def _fetch_daily_data():
+        try:
+            fields = 'ts_code,trade_date,open,high,low,close,pre_close,change,pct_chg,vol,amount'
             if ts_codes:
-                # 指定股票代码
-                all_data = []
-                # 分批获取，每次50只
-                for i in range(0, len(ts_codes), 50):
-                    batch_codes = ts_codes[i:i+50]
-                    df = self.pro.daily(
-                        ts_code=','.join(batch_codes),
-                        trade_date=trade_date,
-                        fields='ts_code,trade_date,open,high,low,close,pre_close,change,pct_chg,vol,amount'
-                    )
-                    all_data.append(df)
-                    time.sleep(0.3)  # 避免频率限制
-                
-                if all_data:
-                    df = pd.concat(all_data, ignore_index=True)
-                else:
-                    df = pd.DataFrame()
+                # 指定股票代码，分批并发获取
+                df = await self._fetch_batches('daily', ts_codes, trade_date=trade_date, fields=fields)
             else:
                 # 获取所有股票的指定日期数据
-                df = self.pro.daily(
-                    trade_date=trade_date,
-                    fields='ts_code,trade_date,open,high,low,close,pre_close,change,pct_chg,vol,amount'
-                )
-            return df
-        
-        try:
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(None, _fetch_daily_data)
+                df = await self._run(self.pro.daily, trade_date=trade_date, fields=fields)
             
-            daily_data = []
-            for _, row in df.iterrows():
-                data = DailyData(
-                    ts_code=row['ts_code'],
-                    trade_date=pd.to_datetime(row['trade_date']).date(),
-                    open=Decimal(str(row['open'])) if pd.notna(row['open']) else None,
-                    high=Decimal(str(row['high'])) if pd.notna(row['high']) else None,
-                    low=Decimal(str(row['low'])) if pd.notna(row['low']) else None,
-                    close=Decimal(str(row['close'])) if pd.notna(row['close']) else None,
-                    pre_close=Decimal(str(row['pre_close'])) if pd.notna(row['pre_close']) else None,
-                    change=Decimal(str(row['change'])) if pd.notna(row['change']) else None,
-                    pct_chg=Decimal(str(row['pct_chg'])) if pd.notna(row['pct_chg']) else None,
-                    vol=int(row['vol']) if pd.notna(row['vol']) else None,
-                    amount=Decimal(str(row['amount'])) if pd.notna(row['amount']) else None
-                )
-                daily_data.append(data)
+            # 按列整体转换（空值为None）后批量构建模型，不再逐行判断和格式化
+            daily_data = await self._to_models(DailyData, df, {
+                'ts_code': None,
+                'trade_date': _date_values,
+                'open': _decimal_values,
+                'high': _decimal_values,
+                'low': _decimal_values,
+                'close': _decimal_values,
+                'pre_close': _decimal_values,
+                'change': _decimal_values,
+                'pct_chg': _decimal_values,
+                'vol': _int_values,
+                'amount': _decimal_values
+            })
             
             logger.info(f"获取到 {len(daily_data)} 条日线数据")
             return daily_data
@@ -182,56 +421,33 @@ Tushare API客户端类
     async def get_daily_basic(self, trade_date: Optional[str] = None,
                             ts_codes: Optional[List[str]] = None) -> List[DailyBasic]:
         """获取每日基本面数据"""
-        await self._wait_for_rate_limit()
+        await self._wait_for_rate_limit('daily_basic')
         
-        def _fetch_daily_basic():
+        try:
+            fields = 'ts_code,trade_date,close,turnover_rate,volume_ratio,pe,pb,ps,dv_ratio,dv_ttm,total_share,float_share,free_share,total_mv,circ_mv'
             if ts_codes:
-                all_data = []
-                for i in range(0, len(ts_codes), 50):
-                    batch_codes = ts_codes[i:i+50]
-                    df = self.pro.daily_basic(
-                        ts_code=','.join(batch_codes),
-                        trade_date=trade_date,
-                        fields='ts_code,trade_date,close,turnover_rate,volume_ratio,pe,pb,ps,dv_ratio,dv_ttm,total_share,float_share,free_share,total_mv,circ_mv'
-                    )
-                    all_data.append(df)
-                    time.sleep(0.3)
-                
-                if all_data:
-                    df = pd.concat(all_data, ignore_index=True)
-                else:
-                    df = pd.DataFrame()
+                df = await self._fetch_batches('daily_basic', ts_codes, trade_date=trade_date, fields=fields)
             else:
-                df = self.pro.daily_basic(
-                    trade_date=trade_date,
-                    fields='ts_code,trade_date,close,turnover_rate,volume_ratio,pe,pb,ps,dv_ratio,dv_ttm,total_share,float_share,free_share,total_mv,circ_mv'
-                )
-            return df
-        
-        try:
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(None, _fetch_daily_basic)
+                df = await self._run(self.pro.daily_basic, trade_date=trade_date, fields=fields)
             
-            basic_data = []
-            for _, row in df.iterrows():
-                data = DailyBasic(
-                    ts_code=row['ts_code'],
-                    trade_date=pd.to_datetime(row['trade_date']).date(),
-                    close=Decimal(str(row['close'])) if pd.notna(row['close']) else None,
-                    turnover_rate=Decimal(str(row['turnover_rate'])) if pd.notna(row['turnover_rate']) else None,
-                    volume_ratio=Decimal(str(row['volume_ratio'])) if pd.notna(row['volume_ratio']) else None,
-                    pe=Decimal(str(row['pe'])) if pd.notna(row['pe']) else None,
-                    pb=Decimal(str(row['pb'])) if pd.notna(row['pb']) else None,
-                    ps=Decimal(str(row['ps'])) if pd.notna(row['ps']) else None,
-                    dv_ratio=Decimal(str(row['dv_ratio'])) if pd.notna(row['dv_ratio']) else None,
-                    dv_ttm=Decimal(str(row['dv_ttm'])) if pd.notna(row['dv_ttm']) else None,
-                    total_share=Decimal(str(row['total_share'])) if pd.notna(row['total_share']) else None,
-                    float_share=Decimal(str(row['float_share'])) if pd.notna(row['float_share']) else None,
-                    free_share=Decimal(str(row['free_share'])) if pd.notna(row['free_share']) else None,
-                    total_mv=Decimal(str(row['total_mv'])) if pd.notna(row['total_mv']) else None,
-                    circ_mv=Decimal(str(row['circ_mv'])) if pd.notna(row['circ_mv']) else None
-                )
-                basic_data.append(data)
+            # 按列整体转换（空值为None）后批量构建模型，不再逐行判断和格式化
+            basic_data = await self._to_models(DailyBasic, df, {
+                'ts_code': None,
+                'trade_date': _date_values,
+                'close': _decimal_values,
+                'turnover_rate': _decimal_values,
+                'volume_ratio': _decimal_values,
+                'pe': _decimal_values,
+                'pb': _decimal_values,
+                'ps': _decimal_values,
+                'dv_ratio': _decimal_values,
+                'dv_ttm': _decimal_values,
+                'total_share': _decimal_values,
+                'float_share': _decimal_values,
+                'free_share': _decimal_values,
+                'total_mv': _decimal_values,
+                'circ_mv': _decimal_values
+            })
             
             logger.info(f"获取到 {len(basic_data)} 条每日基本面数据")
             return basic_data
@@ -243,33 +459,27 @@ Tushare API客户端类
     @api_retry(max_retries=3, delay=1.0)
     async def get_limit_list(self, trade_date: str) -> List[LimitListData]:
         """获取涨跌停统计数据"""
-        await self._wait_for_rate_limit()
+        await self._wait_for_rate_limit('limit_list_d')
         
-        def _fetch_limit_list():
-            df = self.pro.limit_list_d(
+        try:
+            df = await self._run(
+                self.pro.limit_list_d,
                 trade_date=trade_date,
                 fields='ts_code,trade_date,limit,fd_amount,first_time,last_time,open_times,strth,limit_times'
             )
-            return df
-        
-        try:
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(None, _fetch_limit_list)
             
-            limit_data = []
-            for _, row in df.iterrows():
-                data = LimitListData(
-                    ts_code=row['ts_code'],
-                    trade_date=pd.to_datetime(row['trade_date']).date(),
-                    limit=row['limit'],
-                    fd_amount=Decimal(str(row['fd_amount'])) if pd.notna(row['fd_amount']) else None,
-                    first_time=pd.to_datetime(row['first_time']).time() if pd.notna(row['first_time']) else None,
-                    last_time=pd.to_datetime(row['last_time']).time() if pd.notna(row['last_time']) else None,
-                    open_times=int(row['open_times']) if pd.notna(row['open_times']) else None,
-                    strth=Decimal(str(row['strth'])) if pd.notna(row['strth']) else None,
-                    limit_times=int(row['limit_times']) if pd.notna(row['limit_times']) else None
-                )
-                limit_data.append(data)
+            # 按列整体转换（空值为None）后批量构建模型，不再逐行判断和格式化
+            limit_data = await self._to_models(LimitListData, df, {
+                'ts_code': None,
+                'trade_date': _date_values,
+                'limit': None,
+                'fd_amount': _decimal_values,
+                'first_time': _time_values,
+                'last_time': _time_values,
+                'open_times': _int_values,
+                'strth': _decimal_values,
+                'limit_times': _int_values
+            })
             
             logger.info(f"获取到 {len(limit_data)} 条涨跌停数据")
             return limit_data
@@ -279,63 +489,43 @@ Tushare API客户端类
             raise
     
     @api_retry(max_retries=3, delay=1.0)
-    async def get_money_flow(self, trade_date: str, ts_codes: List[str]) -> List[MoneyFlowData]:
-        """获取资金流向数据"""
-        await self._wait_for_rate_limit()
-        
-        def _fetch_money_flow():
-            all_data = []
-            # 分批获取，每次30只（资金流向数据量较大）
-            for i in range(0, len(ts_codes), 30):
-                batch_codes = ts_codes[i:i+30]
-                try:
-                    df = self.pro.moneyflow(
-                        ts_code=','.join(batch_codes),
-                        trade_date=trade_date,
-                        fields='ts_code,trade_date,buy_sm_vol,buy_sm_amount,sell_sm_vol,sell_sm_amount,buy_md_vol,buy_md_amount,sell_md_vol,sell_md_amount,buy_lg_vol,buy_lg_amount,sell_lg_vol,sell_lg_amount,buy_elg_vol,buy_elg_amount,sell_elg_vol,sell_elg_amount,net_mf_vol,net_mf_amount'
-                    )
-                    if not df.empty:
-                        all_data.append(df)
-                except Exception as e:
-                    logger.warning(f"获取资金流向数据失败 (batch {i}-{i+30}): {e}")
-                
-                time.sleep(0.5)  # 资金流向数据调用频率限制更严格
-            
-            if all_data:
-                df = pd.concat(all_data, ignore_index=True)
-            else:
-                df = pd.DataFrame()
-            return df
+    async def get_money_flow(self, trade_date: str, ts_codes: Optional[List[str]] = None) -> List[MoneyFlowData]:
+        """获取资金流向数据（按交易日整日获取，指定ts_codes时在本地过滤）"""
+        await self._wait_for_rate_limit('moneyflow')
         
         try:
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(None, _fetch_money_flow)
+            # 按交易日一次取回全市场数据，替代按股票分批调用
+            df = await self._run(
+                self.pro.moneyflow,
+                trade_date=trade_date,
+                fields='ts_code,trade_date,buy_sm_vol,buy_sm_amount,sell_sm_vol,sell_sm_amount,buy_md_vol,buy_md_amount,sell_md_vol,sell_md_amount,buy_lg_vol,buy_lg_amount,sell_lg_vol,sell_lg_amount,buy_elg_vol,buy_elg_amount,sell_elg_vol,sell_elg_amount,net_mf_vol,net_mf_amount'
+            )
+            if ts_codes is not None and not df.empty:
+                df = df[df['ts_code'].isin(ts_codes)]
             
-            money_flow_data = []
-            for _, row in df.iterrows():
-                data = MoneyFlowData(
-                    ts_code=row['ts_code'],
-                    trade_date=pd.to_datetime(row['trade_date']).date(),
-                    buy_sm_vol=int(row['buy_sm_vol']) if pd.notna(row['buy_sm_vol']) else None,
-                    buy_sm_amount=Decimal(str(row['buy_sm_amount'])) if pd.notna(row['buy_sm_amount']) else None,
-                    sell_sm_vol=int(row['sell_sm_vol']) if pd.notna(row['sell_sm_vol']) else None,
-                    sell_sm_amount=Decimal(str(row['sell_sm_amount'])) if pd.notna(row['sell_sm_amount']) else None,
-                    buy_md_vol=int(row['buy_md_vol']) if pd.notna(row['buy_md_vol']) else None,
-                    buy_md_amount=Decimal(str(row['buy_md_amount'])) if pd.notna(row['buy_md_amount']) else None,
-                    sell_md_vol=int(row['sell_md_vol']) if pd.notna(row['sell_md_vol']) else None,
-                    sell_md_amount=Decimal(str(row['sell_md_amount'])) if pd.notna(row['sell_md_amount']) else None,
-                    buy_lg_vol=int(row['buy_lg_vol']) if pd.notna(row['buy_lg_vol']) else None,
-                    buy_lg_amount=Decimal(str(row['buy_lg_amount'])) if pd.notna(row['buy_lg_amount']) else None,
-                    sell_lg_vol=int(row['sell_lg_vol']) if pd.notna(row['sell_lg_vol']) else None,
-                    sell_lg_amount=Decimal(str(row['sell_lg_amount'])) if pd.notna(row['sell_lg_amount']) else None,
-                    buy_elg_vol=int(row['buy_elg_vol']) if pd.notna(row['buy_elg_vol']) else None,
-                    buy_elg_amount=Decimal(str(row['buy_elg_amount'])) if pd.notna(row['buy_elg_amount']) else None,
-                    sell_elg_vol=int(row['sell_elg_vol']) if pd.notna(row['sell_elg_vol']) else None,
-                    sell_elg_amount=Decimal(str(row['sell_elg_amount'])) if pd.notna(row['sell_elg_amount']) else None,
-                    net_mf_vol=int(row['net_mf_vol']) if pd.notna(row['net_mf_vol']) else None,
-                    net_mf_amount=Decimal(str(row['net_mf_amount'])) if pd.notna(row['net_mf_amount']) else None
-                )
-                money_flow_data.append(data)
+            # 按列整体转换（空值为None）后批量构建模型，不再逐行判断和格式化
+            money_flow_data = await self._to_models(MoneyFlowData, df, {
+                'ts_code': None,
+                'trade_date': _date_values,
+                'buy_sm_vol': _int_values,
+                'buy_sm_amount': _decimal_values,
+                'sell_sm_vol': _int_values,
+                'sell_sm_amount': _decimal_values,
+                'buy_md_vol': _int_values,
+                'buy_md_amount': _decimal_values,
+                'sell_md_vol': _int_values,
+                'sell_md_amount': _decimal_values,
+                'buy_lg_vol': _int_values,
+                'buy_lg_amount': _decimal_values,
+                'sell_lg_vol': _int_values,
+                'sell_lg_amount': _decimal_values,
+                'buy_elg_vol': _int_values,
+                'buy_elg_amount': _decimal_values,
+                'sell_elg_vol': _int_values,
+                'sell_elg_amount': _decimal_values,
+                'net_mf_vol': _int_values,
+                'net_mf_amount': _decimal_values
+            })
             
             logger.info(f"获取到 {len(money_flow_data)} 条资金流向数据")
             return money_flow_data
@@ -347,39 +537,33 @@ Tushare API客户端类
     @api_retry(max_retries=3, delay=1.0)
     async def get_top_list(self, trade_date: str) -> List[TopListData]:
         """获取龙虎榜数据"""
-        await self._wait_for_rate_limit()
+        await self._wait_for_rate_limit('top_list')
         
-        def _fetch_top_list():
-            df = self.pro.top_list(
+        try:
+            df = await self._run(
+                self.pro.top_list,
                 trade_date=trade_date,
                 fields='trade_date,ts_code,name,close,pct_chg,turnover_rate,amount,l_sell,l_buy,l_amount,net_amount,net_rate,amount_rate,float_values,reason'
             )
-            return df
-        
-        try:
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(None, _fetch_top_list)
             
-            top_list_data = []
-            for _, row in df.iterrows():
-                data = TopListData(
-                    trade_date=pd.to_datetime(row['trade_date']).date(),
-                    ts_code=row['ts_code'],
-                    name=row['name'],
-                    close=Decimal(str(row['close'])) if pd.notna(row['close']) else None,
-                    pct_chg=Decimal(str(row['pct_chg'])) if pd.notna(row['pct_chg']) else None,
-                    turnover_rate=Decimal(str(row['turnover_rate'])) if pd.notna(row['turnover_rate']) else None,
-                    amount=Decimal(str(row['amount'])) if pd.notna(row['amount']) else None,
-                    l_sell=Decimal(str(row['l_sell'])) if pd.notna(row['l_sell']) else None,
-                    l_buy=Decimal(str(row['l_buy'])) if pd.notna(row['l_buy']) else None,
-                    l_amount=Decimal(str(row['l_amount'])) if pd.notna(row['l_amount']) else None,
-                    net_amount=Decimal(str(row['net_amount'])) if pd.notna(row['net_amount']) else None,
-                    net_rate=Decimal(str(row['net_rate'])) if pd.notna(row['net_rate']) else None,
-                    amount_rate=Decimal(str(row['amount_rate'])) if pd.notna(row['amount_rate']) else None,
-                    float_values=Decimal(str(row['float_values'])) if pd.notna(row['float_values']) else None,
-                    reason=row['reason']
-                )
-                top_list_data.append(data)
+            # 按列整体转换（空值为None）后批量构建模型，不再逐行判断和格式化
+            top_list_data = await self._to_models(TopListData, df, {
+                'trade_date': _date_values,
+                'ts_code': None,
+                'name': None,
+                'close': _decimal_values,
+                'pct_chg': _decimal_values,
+                'turnover_rate': _decimal_values,
+                'amount': _decimal_values,
+                'l_sell': _decimal_values,
+                'l_buy': _decimal_values,
+                'l_amount': _decimal_values,
+                'net_amount': _decimal_values,
+                'net_rate': _decimal_values,
+                'amount_rate': _decimal_values,
+                'float_values': _decimal_values,
+                'reason': None
+            })
             
             logger.info(f"获取到 {len(top_list_data)} 条龙虎榜数据")
             return top_list_data
@@ -391,32 +575,26 @@ Tushare API客户端类
     @api_retry(max_retries=3, delay=1.0)
     async def get_top_inst(self, trade_date: str) -> List[TopInstData]:
         """获取龙虎榜机构数据"""
-        await self._wait_for_rate_limit()
+        await self._wait_for_rate_limit('top_inst')
         
-        def _fetch_top_inst():
-            df = self.pro.top_inst(
+        try:
+            df = await self._run(
+                self.pro.top_inst,
                 trade_date=trade_date,
                 fields='trade_date,ts_code,exalter,buy,buy_rate,sell,sell_rate,net_buy'
             )
-            return df
-        
-        try:
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(None, _fetch_top_inst)
             
-            top_inst_data = []
-            for _, row in df.iterrows():
-                data = TopInstData(
-                    trade_date=pd.to_datetime(row['trade_date']).date(),
-                    ts_code=row['ts_code'],
-                    exalter=row['exalter'],
-                    buy=Decimal(str(row['buy'])) if pd.notna(row['buy']) else None,
-                    buy_rate=Decimal(str(row['buy_rate'])) if pd.notna(row['buy_rate']) else None,
-                    sell=Decimal(str(row['sell'])) if pd.notna(row['sell']) else None,
-                    sell_rate=Decimal(str(row['sell_rate'])) if pd.notna(row['sell_rate']) else None,
-                    net_buy=Decimal(str(row['net_buy'])) if pd.notna(row['net_buy']) else None
-                )
-                top_inst_data.append(data)
+            # 按列整体转换（空值为None）后批量构建模型，不再逐行判断和格式化
+            top_inst_data = await self._to_models(TopInstData, df, {
+                'trade_date': _date_values,
+                'ts_code': None,
+                'exalter': None,
+                'buy': _decimal_values,
+                'buy_rate': _decimal_values,
+                'sell': _decimal_values,
+                'sell_rate': _decimal_values,
+                'net_buy': _decimal_values
+            })
             
             logger.info(f"获取到 {len(top_inst_data)} 条龙虎榜机构数据")
             return top_inst_data
@@ -429,14 +607,10 @@ Tushare API客户端类
         """测试API连接"""
         try:
             # 简单测试：获取交易日历
-            await self._wait_for_rate_limit()
+            await self._wait_for_rate_limit('trade_cal')
             
-            def _test_api():
-                df = self.pro.trade_cal(start_date='20240101', end_date='20240102')
-                return len(df) > 0
-            
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, _test_api)
+            df = await self._run(self.pro.trade_cal, start_date='20240101', end_date='20240102')
+            result = len(df) > 0
             
             if result:
                 logger.info("Tushare API连接测试成功")
@@ -451,3 +625,22 @@ Tushare API客户端类
         if target_date is None:
             target_date = datetime.now().date()
         return target_date.strftime('%Y%m%d')
+
+
+# 进程内共享的客户端：各StrategyEngine/调度器共用同一套线程池、HTTP会话、频率控制和缓存
+_shared_client: Optional[TushareClient] = None
+
+def get_tushare_client() -> TushareClient:
+    """获取进程内共享的TushareClient（首次调用时创建）"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = TushareClient()
+    return _shared_client
+
+def close_tushare_client():
+    """关闭共享的TushareClient"""
+    global _shared_client
+    if _shared_client:
+        _shared_client.close()
+        _shared_client = None
+        logger.info("Tushare客户端已关闭")
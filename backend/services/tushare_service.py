@@ -1,35 +1,42 @@
 """
 Tushare数据服务
 负责从Tushare API获取真实股票数据
+
+以DataFrame形式返回结果的薄适配层，实际调用委托给进程内共享的TushareClient，
+共用其线程池、HTTP会话和调用频率控制
 """
 
-import tushare as ts
 import pandas as pd
+import asyncio
 import logging
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Any
-from config import settings
+from services.tushare_client import TushareClient, get_tushare_client
 
 logger = logging.getLogger(__name__)
 
 class TushareService:
     """Tushare数据服务类"""
     
-    def __init__(self):
-        """初始化Tushare API"""
-        try:
-            ts.set_token(settings.tushare_token)
-            self.pro = ts.pro_api()
-            logger.info("Tushare API初始化成功")
-        except Exception as e:
-            logger.error(f"Tushare API初始化失败: {e}")
-            raise
+    def __init__(self, client: Optional[TushareClient] = None):
+        """初始化Tushare API（token和Pro客户端由TushareClient负责，默认使用进程内共享的客户端）"""
+        self.client = client or get_tushare_client()
+    
+    async def _call(self, api_name: str, cached: bool = False, **kwargs) -> pd.DataFrame:
+        """
+        经TushareClient调用Pro接口（线程池执行并受频率控制），调用方可并发请求
+        
+        cached=True时使用客户端的准静态结果缓存
+        """
+        return await self.client.query_dataframe(api_name, cached=cached, **kwargs)
     
     async def get_stock_basic(self) -> pd.DataFrame:
-        """获取股票基本信息"""
+        """获取股票基本信息（股票列表一天内基本不变，使用客户端缓存）"""
         try:
             # 获取A股股票基本信息
-            df = self.pro.stock_basic(
+            df = await self._call(
+                'stock_basic',
+                cached=True,
                 exchange='',
                 list_status='L',
                 fields='ts_code,symbol,name,area,industry,market,list_date'
@@ -50,7 +57,8 @@ class TushareService:
             if '-' in trade_date:
                 trade_date = trade_date.replace('-', '')
             
-            df = self.pro.daily(
+            df = await self._call(
+                'daily',
                 trade_date=trade_date,
                 fields='ts_code,trade_date,open,high,low,close,pre_close,change,pct_chg,vol,amount'
             )
@@ -69,7 +77,8 @@ class TushareService:
             if '-' in trade_date:
                 trade_date = trade_date.replace('-', '')
             
-            df = self.pro.daily_basic(
+            df = await self._call(
+                'daily_basic',
                 trade_date=trade_date,
                 fields='ts_code,trade_date,turnover_rate,volume_ratio,pe,pb,ps,dv_ratio,dv_ttm,total_share,float_share,free_share,total_mv,circ_mv'
             )
@@ -89,14 +98,16 @@ class TushareService:
                 trade_date = trade_date.replace('-', '')
             
             # 获取涨停股票
-            df_up = self.pro.limit_list_d(
+            df_up = await self._call(
+                'limit_list_d',
                 trade_date=trade_date,
                 limit_type='U',
                 fields='ts_code,trade_date,name,close,pct_chg,amount,limit_amount,times'
             )
             
             # 获取跌停股票
-            df_down = self.pro.limit_list_d(
+            df_down = await self._call(
+                'limit_list_d',
                 trade_date=trade_date,
                 limit_type='D',
                 fields='ts_code,trade_date,name,close,pct_chg,amount,limit_amount,times'
@@ -122,7 +133,8 @@ class TushareService:
             if '-' in trade_date:
                 trade_date = trade_date.replace('-', '')
             
-            df = self.pro.moneyflow(
+            df = await self._call(
+                'moneyflow',
                 trade_date=trade_date,
                 fields='ts_code,trade_date,buy_sm_amount,buy_md_amount,buy_lg_amount,buy_elg_amount,sell_sm_amount,sell_md_amount,sell_lg_amount,sell_elg_amount,net_mf_amount'
             )
@@ -141,7 +153,8 @@ class TushareService:
             if '-' in trade_date:
                 trade_date = trade_date.replace('-', '')
             
-            df = self.pro.top_list(
+            df = await self._call(
+                'top_list',
                 trade_date=trade_date,
                 fields='ts_code,trade_date,name,close,pct_chg,turnover_rate,amount,l_sell,l_buy,l_amount,net_amount,net_rate,amount_rate,float_values,reason'
             )
@@ -160,7 +173,8 @@ class TushareService:
             if '-' in trade_date:
                 trade_date = trade_date.replace('-', '')
             
-            df = self.pro.top_inst(
+            df = await self._call(
+                'top_inst',
                 trade_date=trade_date,
                 fields='ts_code,trade_date,exalter,buy,buy_rate,sell,sell_rate,net_buy'
             )
@@ -171,14 +185,16 @@ class TushareService:
             raise
     
     async def get_trade_cal(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
-        """获取交易日历"""
+        """获取交易日历（按起止日期使用客户端缓存）"""
         try:
             if not start_date:
                 start_date = (datetime.now() - timedelta(days=30)).strftime('%Y%m%d')
             if not end_date:
                 end_date = datetime.now().strftime('%Y%m%d')
             
-            df = self.pro.trade_cal(
+            df = await self._call(
+                'trade_cal',
+                cached=True,
                 exchange='SSE',
                 start_date=start_date,
                 end_date=end_date,
@@ -193,25 +209,61 @@ class TushareService:
             logger.error(f"获取交易日历失败: {e}")
             raise
     
-    async def get_concept_detail(self, ts_code: str) -> List[str]:
-        """获取股票概念分类"""
+    async def get_daily_history(self, ts_codes: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        批量获取多只股票区间内的收盘价、成交量和换手率
+        
+        收盘价、成交量来自日线接口（daily_basic没有成交量），换手率来自每日指标接口，
+        两个接口按股票分批并发获取后按(ts_code, trade_date)合并，成交量列名为volume
+        """
         try:
-            df = self.pro.concept_detail(
-                ts_code=ts_code,
-                fields='ts_code,concept_name'
+            daily, basic = await asyncio.gather(
+                self.client.query_batches(
+                    'daily', ts_codes,
+                    start_date=start_date,
+                    end_date=end_date,
+                    fields='ts_code,trade_date,close,vol'
+                ),
+                self.client.query_batches(
+                    'daily_basic', ts_codes,
+                    start_date=start_date,
+                    end_date=end_date,
+                    fields='ts_code,trade_date,turnover_rate'
+                )
             )
+            
+            if daily.empty:
+                return daily
+            df = daily.rename(columns={'vol': 'volume'})
+            if basic.empty:
+                df['turnover_rate'] = float('nan')
+            else:
+                df = df.merge(basic, on=['ts_code', 'trade_date'], how='left')
+            
+            logger.info(f"获取{len(ts_codes)}只股票{start_date}到{end_date}历史数据成功，共{len(df)}条记录")
+            return df
+        except Exception as e:
+            logger.error(f"获取历史数据失败: {e}")
+            raise
+    
+    async def get_concept_detail(self, ts_code: str) -> Optional[List[str]]:
+        """获取股票概念分类，请求失败时返回None（与"没有概念"的空列表区分）"""
+        try:
+            # 同步请求放到线程池执行，便于调用方并发获取多只股票的概念
+            df = await self._call('concept_detail', ts_code=ts_code, fields='ts_code,concept_name')
             concepts = df['concept_name'].tolist() if not df.empty else []
             logger.debug(f"获取{ts_code}概念分类成功: {concepts}")
             return concepts
         except Exception as e:
             logger.warning(f"获取{ts_code}概念分类失败: {e}")
-            return []
+            return None
     
     async def validate_api_connection(self) -> bool:
         """验证Tushare API连接"""
         try:
             # 测试获取少量数据
-            df = self.pro.stock_basic(
+            df = await self._call(
+                'stock_basic',
                 exchange='SSE',
                 list_status='L',
                 fields='ts_code,name',
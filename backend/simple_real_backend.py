@@ -4,6 +4,7 @@
 """
 
 import json
+import heapq
 import logging
 from datetime import datetime, timedelta
 from http.server import HTTPServer, BaseHTTPRequestHandler
@@ -162,7 +163,8 @@ def get_real_stock_data(trade_date):
             merged_data = daily_data.merge(daily_basic, on='ts_code', how='left')
         except Exception as e:
             logger.warning(f"获取基本面数据失败: {e}")
-            merged_data = daily_data.copy()
+            # daily_data之后不再使用，直接在其上补列，无需复制
+            merged_data = daily_data
             merged_data['turnover_rate'] = 0
             merged_data['volume_ratio'] = 1
             merged_data['circ_mv'] = 0
@@ -199,8 +201,8 @@ def run_stock_selection_strategy(data):
     try:
         logger.info("开始运行选股策略")
         
-        # 基础筛选
-        filtered = data.copy()
+        # 基础筛选（每步布尔筛选都会生成新表，不会改动缓存中的data，无需先复制）
+        filtered = data
         
         # 市值筛选（小于100亿，数据单位是万元）
         if 'circ_mv' in filtered.columns:
@@ -233,7 +235,7 @@ def run_stock_selection_strategy(data):
         # 计算评分
         candidates = []
         
-        for idx, row in filtered.iterrows():
+        for row in filtered.to_dict('records'):
             try:
                 # 量价分数
                 volume_ratio = row.get('volume_ratio', 1)
@@ -312,16 +314,11 @@ def run_stock_selection_strategy(data):
                 logger.warning(f"处理股票{row['ts_code']}时出错: {e}")
                 continue
         
-        # 按评分排序
-        candidates.sort(key=lambda x: x['total_score'], reverse=True)
-        
-        # 设置排名
+        # 按评分取前30只（堆选择，同分保持原顺序），只对入选的股票设置排名
+        candidates = heapq.nlargest(30, candidates, key=lambda x: x['total_score'])
         for i, candidate in enumerate(candidates):
             candidate['rank_position'] = i + 1
         
-        # 取前30只
-        candidates = candidates[:30]
-        
         logger.info(f"策略运行完成，筛选出{len(candidates)}只候选股票")
         return candidates
         
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+测试批量筹码集中度计算与逐只计算结果一致
+覆盖numba并行内核、NumPy逐只循环以及长表(SoA)入口
+"""
+
+import sys
+import os
+import importlib.util
+from contextlib import contextmanager
+import pandas as pd
+import numpy as np
+import pytest
+
+# 添加当前目录到路径
+sys.path.insert(0, os.path.dirname(__file__))
+
+try:
+    from services import chip_concentration_calculator as chip_module
+except ImportError:
+    # services包的__init__会导入tushare，而筹码计算不依赖它：按文件以原模块名加载
+    # （numba的磁盘缓存按模块名重建，换名加载会与应用共用的缓存冲突）
+    _name = 'services.chip_concentration_calculator'
+    _spec = importlib.util.spec_from_file_location(
+        _name, os.path.join(os.path.dirname(__file__), 'services', 'chip_concentration_calculator.py'))
+    chip_module = importlib.util.module_from_spec(_spec)
+    sys.modules[_name] = chip_module
+    _spec.loader.exec_module(chip_module)
+
+ChipConcentrationCalculator = chip_module.ChipConcentrationCalculator
+CHIP_METRIC_NAMES = chip_module.CHIP_METRIC_NAMES
+calculate_chip_metrics_batch_soa = chip_module.calculate_chip_metrics_batch_soa
+
+# numba内核的成本分布直方图用float32累加，结果四舍五入到4位小数后允许末位差异
+TOLERANCE = 2e-4
+
+
+@contextmanager
+def numba_enabled(enabled: bool):
+    """临时切换计算模块是否走numba内核"""
+    original = chip_module.NUMBA_AVAILABLE
+    chip_module.NUMBA_AVAILABLE = enabled
+    try:
+        yield
+    finally:
+        chip_module.NUMBA_AVAILABLE = original
+
+
+def make_history(rng, days: int, base_price: float, start: str = '2024-10-01') -> pd.DataFrame:
+    """生成一只股票的模拟日线历史（跳过周末，日期间隔不均匀）"""
+    return pd.DataFrame({
+        'date': pd.bdate_range(start=start, periods=days),
+        'close': np.round(base_price * np.exp(np.cumsum(rng.normal(0, 0.02, days))), 2),
+        'volume': rng.uniform(5e5, 3e6, days),
+        'turnover_rate': rng.uniform(1, 15, days),
+    })
+
+
+def make_stocks():
+    """构造多只股票：正常、刚好5条、数据不足、空数据、成交量/换手率含NaN"""
+    rng = np.random.default_rng(20241221)
+    stocks = {
+        'long': (12.5, make_history(rng, 60, 12.0)),
+        'medium': (8.1, make_history(rng, 25, 8.5, start='2024-11-15')),
+        'minimum': (30.0, make_history(rng, 5, 29.0, start='2024-12-16')),
+        'short': (10.3, make_history(rng, 3, 10.0, start='2024-12-18')),
+        'single': (5.0, make_history(rng, 1, 5.0, start='2024-12-20')),
+        'empty': (9.0, make_history(rng, 0, 9.0)),
+    }
+
+    nan_volume = make_history(rng, 40, 15.0)
+    nan_volume.loc[[0, 7, 8, 20, 39], 'volume'] = np.nan
+    stocks['nan_volume'] = (15.2, nan_volume)
+
+    all_nan_volume = make_history(rng, 12, 6.0, start='2024-12-01')
+    all_nan_volume['volume'] = np.nan
+    stocks['all_nan_volume'] = (6.1, all_nan_volume)
+
+    nan_turnover = make_history(rng, 30, 20.0)
+    nan_turnover.loc[[3, 26, 29], 'turnover_rate'] = np.nan
+    stocks['nan_turnover'] = (19.5, nan_turnover)
+
+    return stocks
+
+
+def single_stock_results(stocks):
+    """逐只股票走NumPy路径得到的参考结果"""
+    calculator = ChipConcentrationCalculator()
+    with numba_enabled(False):
+        return {symbol: calculator.calculate_chip_concentration(price, data)
+                for symbol, (price, data) in stocks.items()}
+
+
+def assert_metrics_match(expected: dict, actual: dict, label: str):
+    """比较两组指标：计算方法一致，数值在容差内（NaN视为相等）"""
+    assert actual['calculation_method'] == expected['calculation_method'], label
+    for name in CHIP_METRIC_NAMES:
+        np.testing.assert_allclose(actual[name], expected[name], rtol=0, atol=TOLERANCE,
+                                   err_msg=f"{label}: {name}")
+
+
+def check_batch(enabled: bool):
+    stocks = make_stocks()
+    expected = single_stock_results(stocks)
+
+    calculator = ChipConcentrationCalculator()
+    prices = [price for price, _ in stocks.values()]
+    frames = [data for _, data in stocks.values()]
+    with numba_enabled(enabled):
+        results = calculator.calculate_chip_concentration_batch(prices, frames)
+
+    assert len(results) == len(stocks)
+    for symbol, result in zip(stocks, results):
+        assert_metrics_match(expected[symbol], result, f"batch[{symbol}]")
+
+
+def check_packed(enabled: bool):
+    stocks = make_stocks()
+    expected = single_stock_results(stocks)
+
+    calculator = ChipConcentrationCalculator()
+    packed = {symbol: calculator._extract_history_arrays(price, data)
+              for symbol, (price, data) in stocks.items()}
+    packed = {symbol: arrays for symbol, arrays in packed.items() if arrays is not None}
+
+    columns = [np.concatenate([arrays[k] for arrays in packed.values()]) for k in range(1, 5)]
+    offsets = np.zeros(len(packed) + 1, dtype=np.int64)
+    np.cumsum([len(arrays[1]) for arrays in packed.values()], out=offsets[1:])
+    prices = np.array([arrays[0] for arrays in packed.values()])
+
+    with numba_enabled(enabled):
+        outputs = calculator._calculate_packed(offsets, prices, *columns)
+
+    for symbol, result in zip(packed, calculator._format_metrics(outputs)):
+        assert_metrics_match(expected[symbol], result, f"packed[{symbol}]")
+
+
+def check_soa(enabled: bool):
+    stocks = make_stocks()
+    expected = single_stock_results(stocks)
+
+    # 各股票的行按日期交错排列，确认长表按股票分组后仍保留各自的行序
+    all_history = pd.concat([data.assign(symbol=symbol) for symbol, (_, data) in stocks.items()],
+                            ignore_index=True)
+    all_history = all_history.sample(frac=1, random_state=7).sort_values('date', kind='stable')
+    current_prices = pd.Series({symbol: price for symbol, (price, _) in stocks.items()})
+
+    with numba_enabled(enabled):
+        results = calculate_chip_metrics_batch_soa(all_history, current_prices)
+
+    # 空数据的股票在长表中没有行
+    assert set(results.index) == set(stocks) - {'empty'}
+    for symbol, row in results.iterrows():
+        assert_metrics_match(expected[symbol], row.to_dict(), f"soa[{symbol}]")
+
+
+def test_batch_numpy_matches_single_stock():
+    """批量入口（NumPy路径）与逐只计算一致"""
+    check_batch(enabled=False)
+
+
+def test_packed_numpy_matches_single_stock():
+    """CSR打包数组的NumPy循环与逐只计算一致"""
+    check_packed(enabled=False)
+
+
+def test_soa_numpy_matches_single_stock():
+    """长表入口（NumPy路径）与逐只计算一致"""
+    check_soa(enabled=False)
+
+
+requires_numba = pytest.mark.skipif(not chip_module.NUMBA_AVAILABLE, reason="numba未安装")
+
+
+@requires_numba
+def test_batch_numba_matches_single_stock():
+    """批量入口（numba并行内核）与逐只计算一致"""
+    check_batch(enabled=True)
+
+
+@requires_numba
+def test_packed_numba_matches_single_stock():
+    """CSR打包数组的numba并行内核与逐只计算一致"""
+    check_packed(enabled=True)
+
+
+@requires_numba
+def test_soa_numba_matches_single_stock():
+    """长表入口（numba并行内核）与逐只计算一致"""
+    check_soa(enabled=True)
+
+
+if __name__ == "__main__":
+    print("批量筹码集中度计算一致性测试")
+    print("=" * 60)
+
+    checks = [check_batch, check_packed, check_soa]
+    modes = [False, True] if chip_module.NUMBA_AVAILABLE else [False]
+    for enabled in modes:
+        for check in checks:
+            check(enabled)
+            print(f"✓ {check.__name__} ({'numba' if enabled else 'numpy'})")
+
+    print("=" * 60)
+    print("✓ 所有测试完成！")
@@ -4,7 +4,7 @@ Redis客户端封装
 """
 
 import redis.asyncio as redis
-import json
+import orjson
 import logging
 from typing import Any, Optional, Union
 from datetime import timedelta
@@ -13,6 +13,9 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+# 与json.dumps一样接受非字符串键，另外可直接序列化numpy数值
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 class RedisClient:
     """异步Redis客户端封装"""
     
@@ -62,8 +65,8 @@ class RedisClient:
             if value:
                 try:
                     # 尝试解析JSON
-                    return json.loads(value)
-                except json.JSONDecodeError:
+                    return orjson.loads(value)
+                except orjson.JSONDecodeError:
                     # 如果不是JSON，直接返回字符串
                     return value
             return None
@@ -80,7 +83,7 @@ class RedisClient:
             
             # 如果是复杂对象，转换为JSON
             if isinstance(value, (dict, list)):
-                value = json.dumps(value, ensure_ascii=False)
+                value = orjson.dumps(value, option=_ORJSON_OPTIONS)
             
             # 设置值和过期时间
             result = await self.redis_client.set(key, value, ex=expire)
@@ -149,7 +152,7 @@ class RedisClient:
                 await self.init_redis()
             
             if isinstance(value, (dict, list)):
-                value = json.dumps(value, ensure_ascii=False)
+                value = orjson.dumps(value, option=_ORJSON_OPTIONS)
             
             result = await self.redis_client.hset(name, key, value)
             return bool(result)
@@ -167,8 +170,8 @@ class RedisClient:
             value = await self.redis_client.hget(name, key)
             if value:
                 try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
+                    return orjson.loads(value)
+                except orjson.JSONDecodeError:
                     return value
             return None
             
@@ -188,8 +191,8 @@ class RedisClient:
             parsed_result = {}
             for k, v in result.items():
                 try:
-                    parsed_result[k] = json.loads(v)
-                except json.JSONDecodeError:
+                    parsed_result[k] = orjson.loads(v)
+                except orjson.JSONDecodeError:
                     parsed_result[k] = v
             
             return parsed_result
@@ -235,10 +238,17 @@ class RedisClient:
                 await self.init_redis()
             
             if pattern:
-                # 清理匹配的键
-                keys = await self.redis_client.keys(pattern)
-                if keys:
-                    deleted = await self.redis_client.delete(*keys)
+                # 用SCAN增量遍历代替阻塞的KEYS，分批UNLINK由Redis后台释放内存
+                deleted = 0
+                batch = []
+                async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                    batch.append(key)
+                    if len(batch) >= 500:
+                        deleted += await self.redis_client.unlink(*batch)
+                        batch.clear()
+                if batch:
+                    deleted += await self.redis_client.unlink(*batch)
+                if deleted:
                     logger.info(f"清理缓存: {deleted} 个键匹配 '{pattern}'")
                     return deleted
             else:
@@ -267,7 +277,7 @@ def cache_result(key_prefix: str, expire_hours: int = 1):
         async def wrapper(*args, **kwargs):
             # 生成缓存键
             key_data = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-            key_hash = hashlib.md5(key_data.encode()).hexdigest()[:8]
+            key_hash = hashlib.blake2b(key_data.encode(), digest_size=8).hexdigest()
             cache_key = f"{key_prefix}:{key_hash}"
             
             # 尝试获取缓存